@@ -1,7 +1,12 @@
 import os
+import copy
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Union
+import functools
+import time
+import threading
+import signal
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, Iterator, Mapping
 from datetime import datetime, timedelta
 import asyncio
 import numpy as np
@@ -23,6 +28,84 @@ import aiohttp
 import zmq
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from types import MappingProxyType
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json for report files
+    orjson = None
+
+try:
+    import jsonpatch
+except ImportError:  # Write every report in full
+    jsonpatch = None
+
+# Enhanced default dashboard layout, shared read-only across all users
+_DEFAULT_LAYOUT = MappingProxyType({
+    'widgets': (
+        MappingProxyType({'category': 'surveillance', 'type': 'advanced_map', 'ai_enabled': True}),
+        MappingProxyType({'category': 'operations', 'type': 'task_management', 'ai_enabled': True}),
+        MappingProxyType({'category': 'analytics', 'type': 'predictive_metrics', 'ai_enabled': True}),
+        MappingProxyType({'category': 'quantum', 'type': 'quantum_dashboard', 'quantum_enabled': True}),
+        MappingProxyType({'category': 'ai_coordination', 'type': 'ai_control_center', 'ai_enabled': True})
+    ),
+    'layout_type': 'adaptive_grid',
+    'columns': 4,
+    'ai_optimization': True,
+    'quantum_processing': True,
+    'real_time_updates': True,
+    'adaptive_sizing': True
+})
+
+# Metrics contributing to the system health score, with their weights
+_HEALTH_METRICS = (
+    'processing_efficiency',
+    'predictive_accuracy',
+    'system_reliability',
+    'quantum_coherence',
+    'ai_confidence'
+)
+_HEALTH_METRIC_INDEX = {name: idx for idx, name in enumerate(_HEALTH_METRICS)}
+_HEALTH_WEIGHTS = np.array([0.2, 0.2, 0.3, 0.15, 0.15], dtype=np.float64)
+
+# Health status bands: a score must exceed a threshold to reach the next status
+_HEALTH_THRESHOLDS = np.array([0.6, 0.8, 0.9])
+_HEALTH_STATUSES = ('poor', 'fair', 'good', 'excellent')
+
+# AI models skipped by adaptive optimization (transformer models)
+_SKIP_MODEL_OPTIMIZATION = frozenset({'language_processor'})
+
+# Write a full report every N reports, JSON patches against the previous one in between
+_FULL_REPORT_INTERVAL = 12
+
+# Number of lock-striped shards for per-user dashboard layouts (power of two)
+_LAYOUT_SHARDS = 16
+
+# asyncio.Queue internals used by DrainableQueue's one-pass drain; queues
+# missing any of them fall back to draining through the public API
+_QUEUE_DRAIN_INTERNALS = ('_queue', '_unfinished_tasks', '_finished', '_putters', '_wakeup_next')
+
+# Report date offsets
+_MAINTENANCE_ALERT_OFFSET = timedelta(days=5)
+_MAINTENANCE_WINDOW_OFFSET = timedelta(days=7)
+_LAST_INCIDENT_OFFSET = timedelta(days=15)
+
+# Adaptive layout context rules, shared read-only across all adaptive layouts
+_CONTEXT_RULES = MappingProxyType({
+    'high_threat': MappingProxyType({
+        'prioritize': ('security', 'communications'),
+        'highlight_color': 'red'
+    }),
+    'quantum_processing': MappingProxyType({
+        'prioritize': ('quantum', 'ai_coordination'),
+        'highlight_color': 'blue'
+    }),
+    'performance_issues': MappingProxyType({
+        'prioritize': ('analytics', 'operations'),
+        'highlight_color': 'orange'
+    })
+})
 
 @dataclass
 class QuantumState:
@@ -49,6 +132,108 @@ class AdvancedMetrics:
     ai_confidence: float
     real_time_performance: float
     cross_system_correlation: float
+    
+    def __post_init__(self):
+        self._health_vector = np.array(
+            [getattr(self, name) for name in _HEALTH_METRICS], dtype=np.float64
+        )
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        idx = _HEALTH_METRIC_INDEX.get(name)
+        if idx is not None and '_health_vector' in self.__dict__:
+            self._health_vector[idx] = value
+    
+    def as_vector(self) -> np.ndarray:
+        """Get the health metrics as a vector ordered like _HEALTH_METRICS (do not modify)"""
+        return self._health_vector
+
+class DrainableQueue(asyncio.Queue):
+    """
+    Bounded asyncio queue that can shed its oldest items in a single pass
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._bulk_drain = all(hasattr(self, name) for name in _QUEUE_DRAIN_INTERNALS)
+    
+    def drain(self, count: int) -> int:
+        """
+        Discard up to ``count`` of the oldest queued items without awaiting
+        
+        :param count: Maximum number of items to discard
+        :return: Number of items actually discarded
+        """
+        if not self._bulk_drain:
+            return self._drain_each(count)
+        
+        dropped = max(0, min(count, len(self._queue)))
+        if not dropped:
+            return 0
+        
+        if dropped == len(self._queue):
+            self._queue.clear()
+        else:
+            for _ in range(dropped):
+                self._queue.popleft()
+        
+        # Dropped items will never reach task_done(), so settle them at once
+        self._unfinished_tasks -= dropped
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+        
+        # Release producers blocked on the freed slots
+        for _ in range(min(dropped, len(self._putters))):
+            self._wakeup_next(self._putters)
+        
+        return dropped
+    
+    def _drain_each(self, count: int) -> int:
+        """Discard up to ``count`` items one at a time through the public Queue API"""
+        dropped = 0
+        while dropped < count:
+            try:
+                self.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            self.task_done()
+            dropped += 1
+        return dropped
+
+class ShardedLayoutView(Mapping):
+    """
+    Read-only mapping over lock-striped layout shards; each key is looked up
+    in its own shard only
+    """
+    
+    def __init__(
+        self,
+        shards: List[Dict[str, Dict[str, Any]]],
+        locks: List[threading.Lock],
+        shard_of: Callable[[str], int]
+    ):
+        self._shards = shards
+        self._locks = locks
+        self._shard_of = shard_of
+    
+    def __getitem__(self, user_id: str) -> Dict[str, Any]:
+        shard = self._shard_of(user_id)
+        with self._locks[shard]:
+            return self._shards[shard][user_id]
+    
+    def __contains__(self, user_id: object) -> bool:
+        shard = self._shard_of(user_id)
+        with self._locks[shard]:
+            return user_id in self._shards[shard]
+    
+    def __iter__(self) -> Iterator[str]:
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                user_ids = list(shard)
+            yield from user_ids
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
 
 class AdvancedOverwatchTOSS:
     """
@@ -73,6 +258,11 @@ class AdvancedOverwatchTOSS:
         self.ml_pipelines = {}
         self.quantum_processors = {}
         
+        # Structure-of-arrays mirror of processor coherence for vectorized checks
+        self._quantum_proc_ids: List[str] = []
+        self._quantum_proc_index: Dict[str, int] = {}
+        self._quantum_coherence = np.zeros(0, dtype=np.float64)
+        
         # Initialize distributed computing
         self._initialize_distributed_computing()
         
@@ -87,14 +277,25 @@ class AdvancedOverwatchTOSS:
             'quantum': QuantumProcessingWidget(self.config.get('quantum', {})),
             'ai_coordination': AICoordinationWidget(self.config.get('ai_coordination', {}))
         }
+        self._categories_set = frozenset(self.strategic_categories.keys())
         
         # Real-time data streaming
         self.data_streams = {}
         self.event_processors = {}
         
-        # User dashboard layouts with advanced features
-        self.dashboard_layouts = {}
-        self.adaptive_layouts = {}
+        # Long-running loops started by start_advanced_systems()
+        self._background_tasks: List[asyncio.Task] = []
+        
+        # User dashboard layouts with advanced features, sharded by user id
+        self._dashboard_layout_shards = [{} for _ in range(_LAYOUT_SHARDS)]
+        self._adaptive_layout_shards = [{} for _ in range(_LAYOUT_SHARDS)]
+        self._layout_locks = [threading.Lock() for _ in range(_LAYOUT_SHARDS)]
+        self._dashboard_layouts_view = ShardedLayoutView(
+            self._dashboard_layout_shards, self._layout_locks, self._layout_shard
+        )
+        self._adaptive_layouts_view = ShardedLayoutView(
+            self._adaptive_layout_shards, self._layout_locks, self._layout_shard
+        )
         
         # Performance monitoring
         self.performance_metrics = AdvancedMetrics(
@@ -107,6 +308,12 @@ class AdvancedOverwatchTOSS:
             cross_system_correlation=0.0
         )
         
+        # Comprehensive report cache shared by concurrent callers
+        self._report_cache: Optional[Dict[str, Any]] = None
+        self._report_cache_time = 0.0
+        self._report_cache_ttl = self.config.get('global', {}).get('report_cache_ttl_seconds', 30)
+        self._report_lock = asyncio.Lock()
+        
         # Communication infrastructure
         self._setup_advanced_communication()
     
@@ -231,18 +438,28 @@ class AdvancedOverwatchTOSS:
         # Start real-time data streaming
         await self._start_real_time_streaming()
         
-        # Start all strategic category widgets concurrently
-        widget_tasks = [widget.start_advanced() for widget in self.strategic_categories.values()]
-        await asyncio.gather(*widget_tasks)
+        # Start all strategic category widgets concurrently; their loops run
+        # until stop_advanced_systems() cancels them
+        for widget in self.strategic_categories.values():
+            self._background_tasks.append(asyncio.create_task(widget.start_advanced()))
         
         # Start performance monitoring
-        asyncio.create_task(self._monitor_performance())
+        self._background_tasks.append(asyncio.create_task(self._monitor_performance()))
         
         # Start adaptive optimization
-        asyncio.create_task(self._adaptive_optimization_loop())
+        self._background_tasks.append(asyncio.create_task(self._adaptive_optimization_loop()))
         
         self.logger.info("Advanced OverWatch TOSS fully operational with AI and Quantum capabilities")
     
+    async def stop_advanced_systems(self):
+        """
+        Cancel the widget, stream and monitoring loops and wait for them to exit
+        """
+        tasks, self._background_tasks = self._background_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def _initialize_ai_models(self):
         """
         Initialize advanced AI models for decision making and prediction
@@ -329,32 +546,55 @@ class AdvancedOverwatchTOSS:
                     'processing_power': 250
                 }
             }
+            self._index_quantum_processors()
             
             self.quantum_logger.info("Quantum processors initialized successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize quantum processors: {e}")
     
+    def _index_quantum_processors(self):
+        """
+        Rebuild the coherence array mirroring each processor's quantum state
+        """
+        self._quantum_proc_ids = list(self.quantum_processors.keys())
+        self._quantum_proc_index = {proc_id: idx for idx, proc_id in enumerate(self._quantum_proc_ids)}
+        self._quantum_coherence = np.fromiter(
+            (proc['state'].coherence for proc in self.quantum_processors.values()),
+            dtype=np.float64,
+            count=len(self._quantum_proc_ids)
+        )
+    
+    def _set_quantum_coherence(self, processor_id: str, coherence: float):
+        """
+        Update a processor's coherence in both its state and the coherence array
+        
+        :param processor_id: Quantum processor identifier
+        :param coherence: New coherence value
+        """
+        self.quantum_processors[processor_id]['state'].coherence = coherence
+        self._quantum_coherence[self._quantum_proc_index[processor_id]] = coherence
+    
     async def _start_real_time_streaming(self):
         """
         Initialize real-time data streaming infrastructure
         """
         self.data_streams = {
-            'surveillance_stream': asyncio.Queue(maxsize=1000),
-            'operations_stream': asyncio.Queue(maxsize=1000),
-            'analytics_stream': asyncio.Queue(maxsize=1000),
-            'security_stream': asyncio.Queue(maxsize=1000),
-            'quantum_stream': asyncio.Queue(maxsize=500),
-            'ai_decision_stream': asyncio.Queue(maxsize=500)
+            'surveillance_stream': DrainableQueue(maxsize=1000),
+            'operations_stream': DrainableQueue(maxsize=1000),
+            'analytics_stream': DrainableQueue(maxsize=1000),
+            'security_stream': DrainableQueue(maxsize=1000),
+            'quantum_stream': DrainableQueue(maxsize=500),
+            'ai_decision_stream': DrainableQueue(maxsize=500)
         }
         
         # Start stream processors
         for stream_name, queue in self.data_streams.items():
-            asyncio.create_task(self._process_data_stream(stream_name, queue))
+            self._background_tasks.append(asyncio.create_task(self._process_data_stream(stream_name, queue)))
         
         self.logger.info("Real-time data streaming initialized")
     
-    async def _process_data_stream(self, stream_name: str, queue: asyncio.Queue):
+    async def _process_data_stream(self, stream_name: str, queue: DrainableQueue):
         """
         Process real-time data streams
         
@@ -492,7 +732,7 @@ class AdvancedOverwatchTOSS:
             }
             
             # Update quantum state
-            processor['state'].coherence *= 0.99  # Slight decoherence
+            self._set_quantum_coherence(available_processor, processor['state'].coherence * 0.99)  # Slight decoherence
             processor['state'].last_measurement = datetime.now()
             
             self.quantum_logger.info(f"Quantum task completed: {task_id}")
@@ -546,6 +786,9 @@ class AdvancedOverwatchTOSS:
                 
         except Exception as e:
             self.logger.error(f"Error processing surveillance data: {e}")
+        finally:
+            # Let the surveillance widget refresh now rather than at its next timeout
+            self.strategic_categories['surveillance'].notify_data_available()
 
     async def _process_operations_data(self, data: Dict[str, Any]):
         """Process operations stream data with efficiency analysis"""
@@ -560,6 +803,9 @@ class AdvancedOverwatchTOSS:
                 
         except Exception as e:
             self.logger.error(f"Error processing operations data: {e}")
+        finally:
+            # Let the operations widget refresh now rather than at its next timeout
+            self.strategic_categories['operations'].notify_data_available()
 
     async def _process_analytics_data(self, data: Dict[str, Any]):
         """Process analytics stream data with predictive modeling"""
@@ -604,7 +850,10 @@ class AdvancedOverwatchTOSS:
             # Update quantum coherence metrics
             for processor_id, processor in self.quantum_processors.items():
                 if processor_id in data:
-                    processor['state'].coherence = data[processor_id].get('coherence', processor['state'].coherence)
+                    self._set_quantum_coherence(
+                        processor_id,
+                        data[processor_id].get('coherence', processor['state'].coherence)
+                    )
             
             # Publish to Redis
             if self.redis_client:
@@ -730,26 +979,26 @@ class AdvancedOverwatchTOSS:
             self.logger.info("Performing adaptive optimization...")
             
             # Optimize quantum processors
-            for processor_id, processor in self.quantum_processors.items():
-                if processor['state'].coherence < 0.7:
-                    processor['state'].coherence = min(1.0, processor['state'].coherence + 0.1)
-                    self.quantum_logger.info(f"Optimized quantum processor {processor_id}")
+            coherence = self._quantum_coherence
+            low_coherence = coherence < 0.7
+            coherence[low_coherence] = np.minimum(1.0, coherence[low_coherence] + 0.1)
+            for idx in np.flatnonzero(low_coherence):
+                processor_id = self._quantum_proc_ids[idx]
+                self.quantum_processors[processor_id]['state'].coherence = float(coherence[idx])
+                self.quantum_logger.info(f"Optimized quantum processor {processor_id}")
             
             # Optimize AI models (simulate retraining)
-            for model_name in self.ai_models.keys():
-                if model_name not in ['language_processor']:  # Skip transformer models
-                    self.ai_logger.info(f"Optimizing AI model {model_name}")
+            for model_name in self.ai_models:
+                if model_name in _SKIP_MODEL_OPTIMIZATION:
+                    continue
+                self.ai_logger.info(f"Optimizing AI model {model_name}")
             
             # Clear data streams if overloaded
             for stream_name, queue in self.data_streams.items():
                 if queue.qsize() > 800:  # 80% capacity
-                    # Clear some items to prevent overflow
-                    for _ in range(100):
-                        try:
-                            queue.get_nowait()
-                        except asyncio.QueueEmpty:
-                            break
-                    self.logger.info(f"Cleared overloaded stream: {stream_name}")
+                    # Shed the oldest items to prevent overflow
+                    dropped = queue.drain(queue.qsize() - 500)
+                    self.logger.info(f"Cleared overloaded stream: {stream_name} ({dropped} items dropped)")
             
             self.logger.info("Adaptive optimization completed")
             
@@ -778,11 +1027,14 @@ class AdvancedOverwatchTOSS:
             if ai_assisted and 'pattern_clusterer' in self.ai_models:
                 validated_layout = self._optimize_layout_with_ai(validated_layout, user_id)
             
-            # Store layout for the user
-            self.dashboard_layouts[user_id] = validated_layout
-            
             # Create adaptive version
-            self.adaptive_layouts[user_id] = self._create_adaptive_layout(validated_layout)
+            adaptive_layout = self._create_adaptive_layout(validated_layout)
+            
+            # Store both layouts for the user under the user's shard lock
+            shard = self._layout_shard(user_id)
+            with self._layout_locks[shard]:
+                self._dashboard_layout_shards[shard][user_id] = validated_layout
+                self._adaptive_layout_shards[shard][user_id] = adaptive_layout
             
             return validated_layout
             
@@ -790,6 +1042,43 @@ class AdvancedOverwatchTOSS:
             self.logger.error(f"Error creating dashboard layout: {e}")
             return self._get_default_layout()
 
+    def get_dashboard_layout(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's stored dashboard layout
+        
+        :param user_id: User identifier
+        :return: Dashboard layout, or None if the user has none
+        """
+        shard = self._layout_shard(user_id)
+        with self._layout_locks[shard]:
+            return self._dashboard_layout_shards[shard].get(user_id)
+    
+    def get_adaptive_layout(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's stored adaptive dashboard layout
+        
+        :param user_id: User identifier
+        :return: Adaptive layout, or None if the user has none
+        """
+        shard = self._layout_shard(user_id)
+        with self._layout_locks[shard]:
+            return self._adaptive_layout_shards[shard].get(user_id)
+    
+    @property
+    def dashboard_layouts(self) -> Mapping[str, Dict[str, Any]]:
+        """Read-only view of the stored dashboard layouts keyed by user id"""
+        return self._dashboard_layouts_view
+    
+    @property
+    def adaptive_layouts(self) -> Mapping[str, Dict[str, Any]]:
+        """Read-only view of the stored adaptive layouts keyed by user id"""
+        return self._adaptive_layouts_view
+    
+    @staticmethod
+    def _layout_shard(user_id: str) -> int:
+        """Map a user id to its layout shard index"""
+        return hash(user_id) & (_LAYOUT_SHARDS - 1)
+
     def _validate_advanced_dashboard_layout(
         self, 
         layout_config: Dict[str, Any]
@@ -800,30 +1089,13 @@ class AdvancedOverwatchTOSS:
         :param layout_config: Proposed layout configuration
         :return: Validated layout configuration
         """
-        # Enhanced default layout
-        default_layout = {
-            'widgets': [
-                {'category': 'surveillance', 'type': 'advanced_map', 'ai_enabled': True},
-                {'category': 'operations', 'type': 'task_management', 'ai_enabled': True},
-                {'category': 'analytics', 'type': 'predictive_metrics', 'ai_enabled': True},
-                {'category': 'quantum', 'type': 'quantum_dashboard', 'quantum_enabled': True},
-                {'category': 'ai_coordination', 'type': 'ai_control_center', 'ai_enabled': True}
-            ],
-            'layout_type': 'adaptive_grid',
-            'columns': 4,
-            'ai_optimization': True,
-            'quantum_processing': True,
-            'real_time_updates': True,
-            'adaptive_sizing': True
-        }
-        
         # Merge provided configuration with defaults
-        validated_layout = {**default_layout, **layout_config}
+        validated_layout = {**_DEFAULT_LAYOUT, **layout_config}
         
-        # Validate widget categories
+        # Validate widget categories (copied so the shared defaults stay untouched)
         validated_layout['widgets'] = [
-            widget for widget in validated_layout['widgets']
-            if widget['category'] in self.strategic_categories
+            dict(widget) for widget in validated_layout['widgets']
+            if widget['category'] in self._categories_set
         ]
         
         return validated_layout
@@ -862,25 +1134,15 @@ class AdvancedOverwatchTOSS:
         """
         Create adaptive layout that changes based on context
         
+        The returned ``context_rules`` mapping is shared between all layouts
+        and is read-only; copy it before customizing rules for a user.
+        
         :param base_layout: Base layout configuration
         :return: Adaptive layout configuration
         """
         adaptive_layout = base_layout.copy()
         adaptive_layout['adaptive'] = True
-        adaptive_layout['context_rules'] = {
-            'high_threat': {
-                'prioritize': ['security', 'communications'],
-                'highlight_color': 'red'
-            },
-            'quantum_processing': {
-                'prioritize': ['quantum', 'ai_coordination'],
-                'highlight_color': 'blue'
-            },
-            'performance_issues': {
-                'prioritize': ['analytics', 'operations'],
-                'highlight_color': 'orange'
-            }
-        }
+        adaptive_layout['context_rules'] = _CONTEXT_RULES
         return adaptive_layout
 
     def _get_default_layout(self) -> Dict[str, Any]:
@@ -900,27 +1162,70 @@ class AdvancedOverwatchTOSS:
         """
         Generate comprehensive strategic report with AI insights
         
+        Concurrent callers share a single report generation, and a successful
+        report is reused until the cache TTL expires. Each caller gets its own
+        copy, detached from the live widget state the report was built from.
+        
         :return: Comprehensive strategic report with AI analysis
         """
+        async with self._report_lock:
+            if (
+                self._report_cache is not None
+                and time.monotonic() - self._report_cache_time < self._report_cache_ttl
+            ):
+                return copy.deepcopy(self._report_cache)
+            
+            report = await self._build_comprehensive_report()
+            if 'error' not in report:
+                # Snapshot the widgets' live dicts so the cached report stays fixed
+                self._report_cache = copy.deepcopy(report)
+                self._report_cache_time = time.monotonic()
+                return copy.deepcopy(self._report_cache)
+            return report
+    
+    async def _build_comprehensive_report(self) -> Dict[str, Any]:
+        """
+        Build a fresh comprehensive strategic report
+        
+        :return: Comprehensive strategic report with AI analysis
+        """
+        # Capture the report time once and share it with every section
+        now = datetime.now()
+        timestamp = now.isoformat()
+        
         try:
-            # Collect reports from all widgets
+            # Collect reports from all widgets concurrently
+            categories = list(self.strategic_categories.items())
+            widget_results = await asyncio.gather(
+                *(widget.generate_advanced_widget_report(now_iso=timestamp) for _, widget in categories),
+                return_exceptions=True
+            )
             widget_reports = {}
-            for category, widget in self.strategic_categories.items():
-                try:
-                    widget_reports[category] = await widget.generate_advanced_widget_report()
-                except Exception as e:
-                    self.logger.error(f"Error generating report for {category}: {e}")
-                    widget_reports[category] = {'error': str(e)}
-            
-            # Generate AI insights
-            ai_insights = await self._generate_ai_insights()
-            
-            # Generate quantum analysis
-            quantum_analysis = await self._generate_quantum_analysis()
+            for (category, _), result in zip(categories, widget_results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error generating report for {category}: {result}")
+                    widget_reports[category] = {'error': str(result)}
+                else:
+                    widget_reports[category] = result
+            
+            # Generate AI insights, quantum analysis, health and alerts concurrently
+            (
+                ai_insights,
+                quantum_analysis,
+                system_health,
+                recommendations,
+                predictive_alerts
+            ) = await asyncio.gather(
+                self._generate_ai_insights(now),
+                self._generate_quantum_analysis(),
+                self._assess_system_health(now),
+                self._generate_recommendations(),
+                self._generate_predictive_alerts(now)
+            )
             
             # Compile comprehensive report
             report = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'system_id': 'advanced_overwatch_toss',
                 'version': '2.0.0',
                 'strategic_categories': widget_reports,
@@ -935,9 +1240,9 @@ class AdvancedOverwatchTOSS:
                     'real_time_performance': self.performance_metrics.real_time_performance,
                     'cross_system_correlation': self.performance_metrics.cross_system_correlation
                 },
-                'system_health': await self._assess_system_health(),
-                'recommendations': await self._generate_recommendations(),
-                'predictive_alerts': await self._generate_predictive_alerts()
+                'system_health': system_health,
+                'recommendations': recommendations,
+                'predictive_alerts': predictive_alerts
             }
             
             return report
@@ -945,13 +1250,14 @@ class AdvancedOverwatchTOSS:
         except Exception as e:
             self.logger.error(f"Error generating comprehensive report: {e}")
             return {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'error': str(e),
                 'status': 'report_generation_failed'
             }
 
-    async def _generate_ai_insights(self) -> Dict[str, Any]:
+    async def _generate_ai_insights(self, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Generate AI-powered insights from system data"""
+        now = now or datetime.now()
         try:
             insights = {
                 'pattern_analysis': {
@@ -964,7 +1270,7 @@ class AdvancedOverwatchTOSS:
                     'maintenance_windows': [
                         {
                             'component': 'quantum_core_1',
-                            'predicted_date': (datetime.now() + timedelta(days=7)).isoformat(),
+                            'predicted_date': (now + _MAINTENANCE_WINDOW_OFFSET).isoformat(),
                             'confidence': np.random.uniform(0.8, 0.95)
                         }
                     ]
@@ -1012,27 +1318,19 @@ class AdvancedOverwatchTOSS:
             self.logger.error(f"Error generating quantum analysis: {e}")
             return {'error': str(e)}
 
-    async def _assess_system_health(self) -> Dict[str, Any]:
+    async def _assess_system_health(self, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Assess overall system health"""
+        now = now or datetime.now()
         try:
-            health_score = (
-                self.performance_metrics.processing_efficiency * 0.2 +
-                self.performance_metrics.predictive_accuracy * 0.2 +
-                self.performance_metrics.system_reliability * 0.3 +
-                self.performance_metrics.quantum_coherence * 0.15 +
-                self.performance_metrics.ai_confidence * 0.15
-            )
-            
-            health_status = 'excellent' if health_score > 0.9 else \
-                           'good' if health_score > 0.8 else \
-                           'fair' if health_score > 0.6 else 'poor'
+            health_score = float(np.dot(self.performance_metrics.as_vector(), _HEALTH_WEIGHTS))
+            health_status = _HEALTH_STATUSES[np.searchsorted(_HEALTH_THRESHOLDS, health_score, side='left')]
             
             return {
                 'overall_score': health_score,
                 'status': health_status,
                 'critical_issues': await self._identify_critical_issues(),
                 'uptime': '99.7%',  # Simulated
-                'last_incident': (datetime.now() - timedelta(days=15)).isoformat()
+                'last_incident': (now - _LAST_INCIDENT_OFFSET).isoformat()
             }
         except Exception as e:
             self.logger.error(f"Error assessing system health: {e}")
@@ -1043,14 +1341,14 @@ class AdvancedOverwatchTOSS:
         issues = []
         
         # Check quantum coherence
-        for proc_id, processor in self.quantum_processors.items():
-            if processor['state'].coherence < 0.5:
-                issues.append({
-                    'type': 'quantum_decoherence',
-                    'component': proc_id,
-                    'severity': 'high',
-                    'description': f'Quantum processor {proc_id} coherence below threshold'
-                })
+        for idx in np.flatnonzero(self._quantum_coherence < 0.5):
+            proc_id = self._quantum_proc_ids[idx]
+            issues.append({
+                'type': 'quantum_decoherence',
+                'component': proc_id,
+                'severity': 'high',
+                'description': f'Quantum processor {proc_id} coherence below threshold'
+            })
         
         # Check AI model performance
         if self.performance_metrics.ai_confidence < 0.7:
@@ -1086,8 +1384,9 @@ class AdvancedOverwatchTOSS:
         
         return recommendations
 
-    async def _generate_predictive_alerts(self) -> List[Dict[str, Any]]:
+    async def _generate_predictive_alerts(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Generate predictive alerts for future issues"""
+        now = now or datetime.now()
         alerts = []
         
         # Simulate predictive maintenance alerts
@@ -1095,19 +1394,178 @@ class AdvancedOverwatchTOSS:
             alerts.append({
                 'type': 'predictive_maintenance',
                 'component': 'quantum_core_1',
-                'predicted_time': (datetime.now() + timedelta(days=5)).isoformat(),
+                'predicted_time': (now + _MAINTENANCE_ALERT_OFFSET).isoformat(),
                 'confidence': 0.85,
                 'recommended_action': 'Schedule maintenance window'
             })
         
         return alerts
 
+@functools.lru_cache(maxsize=None)
+def _build_threat_detection_model() -> tf.keras.Model:
+    """Build the surveillance threat detection network once per process"""
+    return tf.keras.Sequential([
+        tf.keras.layers.Conv2D(64, (3, 3), activation='relu', input_shape=(224, 224, 3)),
+        tf.keras.layers.MaxPooling2D((2, 2)),
+        tf.keras.layers.Conv2D(32, (3, 3), activation='relu'),
+        tf.keras.layers.MaxPooling2D((2, 2)),
+        tf.keras.layers.Flatten(),
+        tf.keras.layers.Dense(128, activation='relu'),
+        tf.keras.layers.Dense(3, activation='softmax')  # Normal, Suspicious, Threat
+    ])
+
+@functools.lru_cache(maxsize=None)
+def _build_resource_allocation_model() -> tf.keras.Model:
+    """Build the operations resource allocation network once per process"""
+    return tf.keras.Sequential([
+        tf.keras.layers.Dense(128, activation='relu', input_shape=(20,)),
+        tf.keras.layers.Dropout(0.2),
+        tf.keras.layers.Dense(64, activation='relu'),
+        tf.keras.layers.Dense(32, activation='relu'),
+        tf.keras.layers.Dense(10, activation='sigmoid')  # Resource allocation scores
+    ])
+
+class TFLiteRunner:
+    """
+    Dynamic-range int8 quantized TFLite version of a Keras model for CPU inference
+    """
+    
+    def __init__(self, model: tf.keras.Model):
+        """
+        Convert and load a Keras model into a TFLite interpreter
+        
+        :param model: Keras model to quantize
+        """
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        self._interpreter = tf.lite.Interpreter(model_content=converter.convert())
+        self._input_index = self._interpreter.get_input_details()[0]['index']
+        self._output_index = self._interpreter.get_output_details()[0]['index']
+        self._input_shape = None
+    
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run a forward pass, resizing the interpreter input when the batch size changes
+        
+        :param batch: Batched float32 model input
+        :return: Batched model output
+        """
+        if batch.shape != self._input_shape:
+            self._interpreter.resize_tensor_input(self._input_index, batch.shape)
+            self._interpreter.allocate_tensors()
+            self._input_shape = batch.shape
+        
+        self._interpreter.set_tensor(self._input_index, batch.astype(np.float32, copy=False))
+        self._interpreter.invoke()
+        return self._interpreter.get_tensor(self._output_index).copy()
+
+def _keras_runner(model: tf.keras.Model) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Wrap a Keras model as a batch-in, array-out inference function
+    
+    The forward pass is traced once against a fixed input signature, so
+    batches of any size reuse the same concrete function.
+    
+    :param model: Keras model to wrap
+    :return: Inference function
+    """
+    forward = tf.function(
+        lambda batch: model(batch, training=False),
+        input_signature=[tf.TensorSpec([None, *model.input_shape[1:]], tf.float32)]
+    )
+    return lambda batch: forward(batch).numpy()
+
+class InferenceBatcher:
+    """
+    Micro-batcher that coalesces single-sample inferences from many widgets
+    into one batched forward pass of a shared model
+    """
+    
+    def __init__(
+        self,
+        infer: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 32,
+        max_delay: float = 0.005
+    ):
+        """
+        Initialize inference batcher
+        
+        :param infer: Function running a forward pass over a batch of samples
+        :param max_batch_size: Largest number of samples per forward pass
+        :param max_delay: Seconds to wait for more samples after the first arrives
+        """
+        self.infer = infer
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, sample: np.ndarray) -> np.ndarray:
+        """
+        Queue a single sample for batched inference
+        
+        The sample is read when its batch runs, so callers must not modify
+        it until the result is returned.
+        
+        :param sample: Model input without the batch dimension
+        :return: Model output row for the sample
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sample, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queued samples into batches and scatter the results back"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(items) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                batch = np.stack([sample for sample, _ in items])
+                outputs = self.infer(batch)
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), row in zip(items, outputs):
+                if not future.done():
+                    future.set_result(row)
+
+@functools.lru_cache(maxsize=None)
+def _get_resource_allocation_batcher(use_tflite: bool = False) -> InferenceBatcher:
+    """
+    Get the batcher shared by all operations widgets
+    
+    :param use_tflite: Whether to run the quantized TFLite model instead of Keras
+    :return: Shared inference batcher
+    """
+    model = _build_resource_allocation_model()
+    return InferenceBatcher(TFLiteRunner(model) if use_tflite else _keras_runner(model))
+
 # Enhanced Base Widget Class
 class AdvancedBaseWidget(ABC):
     """
     Advanced base class for strategic category widgets with AI and quantum capabilities
     """
     
+    # Longest time a widget waits between refreshes when no data arrives
+    default_update_interval = 15
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize advanced base widget
@@ -1122,6 +1580,20 @@ class AdvancedBaseWidget(ABC):
         self.performance_metrics = {}
         self.data_cache = {}
         self.last_update = datetime.now()
+        self._data_event = asyncio.Event()
+        self._max_interval = config.get('update_interval_seconds', self.default_update_interval)
+    
+    def notify_data_available(self):
+        """Wake the widget's refresh loop because new upstream data has arrived"""
+        self._data_event.set()
+    
+    async def _wait_for_data(self):
+        """Wait until new data is signalled or the maximum refresh interval elapses"""
+        try:
+            await asyncio.wait_for(self._data_event.wait(), timeout=self._max_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._data_event.clear()
     
     @abstractmethod
     async def start_advanced(self):
@@ -1129,8 +1601,12 @@ class AdvancedBaseWidget(ABC):
         pass
     
     @abstractmethod
-    async def generate_advanced_widget_report(self) -> Dict[str, Any]:
-        """Generate advanced widget-specific report"""
+    async def generate_advanced_widget_report(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate advanced widget-specific report
+        
+        :param now_iso: Shared report timestamp; defaults to the current time
+        """
         pass
     
     async def apply_ai_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1176,6 +1652,14 @@ class AdvancedSurveillanceWidget(AdvancedBaseWidget):
         self.computer_vision_enabled = config.get('computer_vision', True)
         self.threat_detection_model = None
         self.motion_analysis_model = None
+        
+        # Report fields fixed at construction, merged into every report
+        self._report_header = {
+            'widget_type': 'advanced_surveillance',
+            'ai_enabled': self.ai_enabled,
+            'quantum_enabled': self.quantum_enabled,
+            'computer_vision_status': self.computer_vision_enabled
+        }
     
     async def start_advanced(self):
         """Start advanced surveillance with AI and quantum capabilities"""
@@ -1187,7 +1671,7 @@ class AdvancedSurveillanceWidget(AdvancedBaseWidget):
             # Start data collection loop
             while True:
                 await self._collect_advanced_tracking_data()
-                await asyncio.sleep(15)  # Update every 15 seconds
+                await self._wait_for_data()  # Refresh on new data, at least every 15 seconds
                 
         except Exception as e:
             self.logger.error(f"Error in advanced surveillance: {e}")
@@ -1195,16 +1679,8 @@ class AdvancedSurveillanceWidget(AdvancedBaseWidget):
     async def _initialize_surveillance_ai(self):
         """Initialize AI models for surveillance"""
         try:
-            # Threat detection neural network
-            self.threat_detection_model = tf.keras.Sequential([
-                tf.keras.layers.Conv2D(64, (3, 3), activation='relu', input_shape=(224, 224, 3)),
-                tf.keras.layers.MaxPooling2D((2, 2)),
-                tf.keras.layers.Conv2D(32, (3, 3), activation='relu'),
-                tf.keras.layers.MaxPooling2D((2, 2)),
-                tf.keras.layers.Flatten(),
-                tf.keras.layers.Dense(128, activation='relu'),
-                tf.keras.layers.Dense(3, activation='softmax')  # Normal, Suspicious, Threat
-            ])
+            # Threat detection neural network (shared across widget instances)
+            self.threat_detection_model = _build_threat_detection_model()
             
             self.logger.info("Surveillance AI models initialized")
         except Exception as e:
@@ -1239,28 +1715,36 @@ class AdvancedSurveillanceWidget(AdvancedBaseWidget):
         except Exception as e:
             self.logger.error(f"Error collecting surveillance data: {e}")
     
-    async def generate_advanced_widget_report(self) -> Dict[str, Any]:
+    async def generate_advanced_widget_report(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Generate advanced surveillance report"""
         return {
-            'widget_type': 'advanced_surveillance',
+            **self._report_header,
             'tracking_data': self.tracking_data,
-            'ai_enabled': self.ai_enabled,
-            'quantum_enabled': self.quantum_enabled,
-            'computer_vision_status': self.computer_vision_enabled,
             'last_update': self.last_update.isoformat(),
             'performance_metrics': self.performance_metrics,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso or datetime.now().isoformat()
         }
 
 # Continue with other enhanced widget classes...
 class AdvancedOperationsWidget(AdvancedBaseWidget):
     """Enhanced operations widget with AI-powered task optimization"""
     
+    default_update_interval = 30
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.task_data = {}
         self.optimization_engine = None
         self.resource_allocation_model = None
+        self.resource_allocation_batcher = None
+        self._alloc_buf = np.zeros((1, 20), dtype=np.float32)  # Reused model input
+        
+        # Report fields fixed at construction, merged into every report
+        self._report_header = {
+            'widget_type': 'advanced_operations',
+            'ai_enabled': self.ai_enabled,
+            'quantum_enabled': self.quantum_enabled
+        }
     
     async def start_advanced(self):
         """Start advanced operations management"""
@@ -1271,7 +1755,7 @@ class AdvancedOperationsWidget(AdvancedBaseWidget):
             while True:
                 await self._collect_advanced_task_data()
                 await self._optimize_task_allocation()
-                await asyncio.sleep(30)  # Update every 30 seconds
+                await self._wait_for_data()  # Refresh on new data, at least every 30 seconds
                 
         except Exception as e:
             self.logger.error(f"Error in advanced operations: {e}")
@@ -1279,14 +1763,15 @@ class AdvancedOperationsWidget(AdvancedBaseWidget):
     async def _initialize_operations_ai(self):
         """Initialize AI models for operations optimization"""
         try:
-            # Resource allocation optimization model
-            self.resource_allocation_model = tf.keras.Sequential([
-                tf.keras.layers.Dense(128, activation='relu', input_shape=(20,)),
-                tf.keras.layers.Dropout(0.2),
-                tf.keras.layers.Dense(64, activation='relu'),
-                tf.keras.layers.Dense(32, activation='relu'),
-                tf.keras.layers.Dense(10, activation='sigmoid')  # Resource allocation scores
-            ])
+            # Resource allocation optimization model (shared across widget instances)
+            self.resource_allocation_model = _build_resource_allocation_model()
+            try:
+                self.resource_allocation_batcher = _get_resource_allocation_batcher(
+                    self.config.get('use_tflite', True)
+                )
+            except Exception as e:
+                self.logger.warning(f"TFLite conversion failed, using Keras model: {e}")
+                self.resource_allocation_batcher = _get_resource_allocation_batcher(False)
             
             self.logger.info("Operations AI models initialized")
         except Exception as e:
@@ -1330,14 +1815,18 @@ class AdvancedOperationsWidget(AdvancedBaseWidget):
         try:
             if self.ai_enabled and self.resource_allocation_model:
                 # Simulate AI-driven optimization
-                current_allocation = list(self.task_data.get('resource_utilization', {}).values())
+                current_allocation = np.fromiter(
+                    self.task_data.get('resource_utilization', {}).values(),
+                    dtype=np.float32
+                )
                 
-                # Pad or truncate to expected input size
-                input_data = (current_allocation + [0] * 20)[:20]
+                # Pad or truncate into the preallocated input buffer
+                n = min(current_allocation.size, self._alloc_buf.shape[1])
+                self._alloc_buf[0, :n] = current_allocation[:n]
+                self._alloc_buf[0, n:] = 0
                 
-                # Generate optimization recommendations
-                input_tensor = tf.expand_dims(input_data, 0)
-                optimization_scores = self.resource_allocation_model.predict(input_tensor, verbose=0)[0]
+                # Generate optimization recommendations, batched with other widgets
+                optimization_scores = await self.resource_allocation_batcher.submit(self._alloc_buf[0])
                 
                 self.task_data['ai_optimization'] = {
                     'recommended_allocation': optimization_scores.tolist(),
@@ -1348,44 +1837,77 @@ class AdvancedOperationsWidget(AdvancedBaseWidget):
         except Exception as e:
             self.logger.error(f"Error in task optimization: {e}")
     
-    async def generate_advanced_widget_report(self) -> Dict[str, Any]:
+    async def generate_advanced_widget_report(self, now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Generate advanced operations report"""
         return {
-            'widget_type': 'advanced_operations',
+            **self._report_header,
             'task_data': self.task_data,
-            'ai_enabled': self.ai_enabled,
-            'quantum_enabled': self.quantum_enabled,
             'optimization_active': self.optimization_engine is not None,
             'last_update': self.last_update.isoformat(),
             'performance_metrics': self.performance_metrics,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso or datetime.now().isoformat()
         }
 
 # Add remaining widget classes (Analytics, Communications, Security, Resources, Quantum, AI Coordination)
 # ... (Due to length constraints, I'll continue with the main execution function)
 
+def _write_report_file(report_filename: str, report: Union[Dict[str, Any], List[Dict[str, Any]]]):
+    """
+    Serialize a report or report patch and write it to disk
+    
+    :param report_filename: Destination file path
+    :param report: Report, or list of JSON patch operations, to serialize
+    """
+    if orjson is not None:
+        Path(report_filename).write_bytes(
+            orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(report_filename, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+
 # Enhanced main execution
 async def main():
     """
     Main entry point for Advanced OverWatch TOSS
     """
     overwatch = AdvancedOverwatchTOSS()
+    last_report = None
+    report_count = 0
+    
+    # Shut down gracefully on SIGTERM (e.g. container stop) as well as Ctrl+C
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:  # Signal handlers are unavailable on Windows event loops
+            pass
     
     try:
         await overwatch.start_advanced_systems()
         
         # Demonstration of advanced capabilities
-        while True:
+        while not shutdown_event.is_set():
             # Generate comprehensive report
             report = await overwatch.generate_comprehensive_report()
             
-            # Save report to file
+            # Save report to file, periodically in full and as a delta otherwise
             log_dir = 'logs/overwatch/reports/advanced'
             os.makedirs(log_dir, exist_ok=True)
-            report_filename = f"{log_dir}/advanced_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            report_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if jsonpatch is None or last_report is None or report_count % _FULL_REPORT_INTERVAL == 0:
+                report_filename = f"{log_dir}/advanced_report_{report_stamp}.json"
+                report_payload = report
+            else:
+                report_filename = f"{log_dir}/advanced_report_{report_stamp}.patch.json"
+                report_patch = await asyncio.to_thread(jsonpatch.make_patch, last_report, report)
+                report_payload = report_patch.patch
             
-            with open(report_filename, 'w') as report_file:
-                json.dump(report, report_file, indent=2)
+            # Serialize and write off the event loop
+            await asyncio.to_thread(_write_report_file, report_filename, report_payload)
+            last_report = report
+            report_count += 1
             
             # Test quantum processing
             if overwatch.quantum_processors:
@@ -1401,12 +1923,20 @@ async def main():
             print(f"AI Confidence: {report.get('performance_metrics', {}).get('ai_confidence', 0):.3f}")
             print(f"Quantum Coherence: {report.get('performance_metrics', {}).get('quantum_coherence', 0):.3f}")
             
-            await asyncio.sleep(300)  # Generate report every 5 minutes
+            # Generate report every 5 minutes, waking early on shutdown
+            try:
+                await asyncio.wait_for(shutdown_event.wait(), timeout=300)
+            except asyncio.TimeoutError:
+                pass
             
-    except KeyboardInterrupt:
+    finally:
+        # Also reached when asyncio.run() cancels main() on Ctrl+C where
+        # signal handlers are unavailable
         print("Shutting down Advanced OverWatch TOSS...")
+        await overwatch.stop_advanced_systems()
         if hasattr(overwatch, 'zmq_context'):
-            overwatch.zmq_context.term()
+            # Close open sockets first, otherwise term() blocks on them
+            overwatch.zmq_context.destroy(linger=0)
         if ray.is_initialized():
             ray.shutdown()
         print("Shutdown complete.")
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+overwatch_toss = pytest.importorskip('overwatch_toss')
+
+
+def _bare_overwatch(widgets):
+    """Build an AdvancedOverwatchTOSS with only the state the stream handlers use"""
+    overwatch = overwatch_toss.AdvancedOverwatchTOSS.__new__(overwatch_toss.AdvancedOverwatchTOSS)
+    overwatch.logger = logging.getLogger('test_overwatch_toss')
+    overwatch.ai_models = {}
+    overwatch.redis_client = None
+    overwatch.strategic_categories = widgets
+    return overwatch
+
+
+@pytest.mark.parametrize('category, widget_cls, collect, handler', [
+    ('surveillance', overwatch_toss.AdvancedSurveillanceWidget,
+     '_collect_advanced_tracking_data', '_process_surveillance_data'),
+    ('operations', overwatch_toss.AdvancedOperationsWidget,
+     '_collect_advanced_task_data', '_process_operations_data'),
+])
+def test_stream_data_refreshes_widget_before_timeout(category, widget_cls, collect, handler):
+    async def scenario():
+        widget = widget_cls({'ai_enabled': False, 'update_interval_seconds': 60})
+        refreshed = asyncio.Event()
+
+        async def record_refresh():
+            refreshed.set()
+
+        setattr(widget, collect, record_refresh)
+        overwatch = _bare_overwatch({category: widget})
+
+        loop_task = asyncio.create_task(widget.start_advanced())
+        try:
+            # First refresh happens immediately on start
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+            refreshed.clear()
+
+            await getattr(overwatch, handler)({'value': 1.0})
+
+            # Far sooner than the 60 second refresh interval
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+        finally:
+            loop_task.cancel()
+            await asyncio.gather(loop_task, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+
+def test_stop_advanced_systems_cancels_widget_loops():
+    async def scenario():
+        widgets = {
+            'surveillance': overwatch_toss.AdvancedSurveillanceWidget({'ai_enabled': False}),
+            'operations': overwatch_toss.AdvancedOperationsWidget({'ai_enabled': False}),
+        }
+        overwatch = _bare_overwatch(widgets)
+        overwatch._background_tasks = [
+            asyncio.create_task(widget.start_advanced()) for widget in widgets.values()
+        ]
+        tasks = list(overwatch._background_tasks)
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(overwatch.stop_advanced_systems(), timeout=1)
+
+        assert all(task.cancelled() for task in tasks)
+        assert overwatch._background_tasks == []
+
+    asyncio.run(scenario())
+
+
+def test_queue_exposes_internals_used_by_bulk_drain():
+    # Fails on a CPython release whose asyncio.Queue internals changed; drain()
+    # then silently takes the slower per-item path
+    async def scenario():
+        assert overwatch_toss.DrainableQueue(maxsize=4)._bulk_drain
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize('bulk', [True, False])
+def test_drain_discards_oldest_items_and_releases_producers(bulk):
+    async def scenario():
+        queue = overwatch_toss.DrainableQueue(maxsize=4)
+        queue._bulk_drain = bulk
+        for item in range(4):
+            queue.put_nowait(item)
+        blocked = [asyncio.create_task(queue.put(item)) for item in (4, 5)]
+        await asyncio.sleep(0)
+
+        assert queue.drain(3) == 3
+        await asyncio.wait_for(asyncio.gather(*blocked), timeout=1)
+        assert [queue.get_nowait() for _ in range(queue.qsize())] == [3, 4, 5]
+        for _ in range(3):
+            queue.task_done()
+
+        assert queue.drain(10) == 0
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+        # Draining every pending item also settles join()
+        queue.put_nowait(6)
+        queue.put_nowait(7)
+        assert queue.drain(10) == 2
+        await asyncio.wait_for(queue.join(), timeout=1)
+
+    asyncio.run(scenario())
+
+
+def test_layout_properties_are_read_only_views_of_the_shards():
+    overwatch = overwatch_toss.AdvancedOverwatchTOSS.__new__(overwatch_toss.AdvancedOverwatchTOSS)
+    overwatch._dashboard_layout_shards = [{} for _ in range(overwatch_toss._LAYOUT_SHARDS)]
+    overwatch._adaptive_layout_shards = [{} for _ in range(overwatch_toss._LAYOUT_SHARDS)]
+    overwatch._layout_locks = [threading.Lock() for _ in range(overwatch_toss._LAYOUT_SHARDS)]
+    overwatch._dashboard_layouts_view = overwatch_toss.ShardedLayoutView(
+        overwatch._dashboard_layout_shards, overwatch._layout_locks, overwatch._layout_shard
+    )
+    overwatch._adaptive_layouts_view = overwatch_toss.ShardedLayoutView(
+        overwatch._adaptive_layout_shards, overwatch._layout_locks, overwatch._layout_shard
+    )
+
+    layouts = overwatch.dashboard_layouts
+    for user_id in ('alice', 'bob', 'carol'):
+        shard = overwatch._layout_shard(user_id)
+        overwatch._dashboard_layout_shards[shard][user_id] = {'user': user_id}
+        overwatch._adaptive_layout_shards[shard][user_id] = {'user': user_id}
+
+    # The view sees layouts stored after it was obtained
+    assert set(layouts) == {'alice', 'bob', 'carol'}
+    assert len(overwatch.adaptive_layouts) == 3
+    assert layouts['bob'] is overwatch.get_dashboard_layout('bob')
+    assert 'dave' not in layouts
+    with pytest.raises(KeyError):
+        layouts['dave']
+    with pytest.raises(TypeError):
+        layouts['dave'] = {}
+
+
+def test_cached_report_is_detached_from_live_widget_state():
+    async def scenario():
+        overwatch = _bare_overwatch({})
+        overwatch._report_cache = None
+        overwatch._report_cache_time = 0.0
+        overwatch._report_cache_ttl = 30
+        overwatch._report_lock = asyncio.Lock()
+        task_data = {'active_tasks': 3}
+        builds = []
+
+        async def build():
+            builds.append(1)
+            return {'strategic_categories': {'operations': {'task_data': task_data}}}
+
+        overwatch._build_comprehensive_report = build
+
+        first = await overwatch.generate_comprehensive_report()
+        task_data['active_tasks'] = 7
+        second = await overwatch.generate_comprehensive_report()
+
+        assert len(builds) == 1
+        assert first is not second
+        assert second['strategic_categories']['operations']['task_data'] == {'active_tasks': 3}
+        first['strategic_categories'].clear()
+        third = await overwatch.generate_comprehensive_report()
+        assert third['strategic_categories']['operations']['task_data'] == {'active_tasks': 3}
+
+    asyncio.run(scenario())
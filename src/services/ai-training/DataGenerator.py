@@ -7,22 +7,112 @@ Synthetic data generation and augmentation for pavement condition training
 import os
 import numpy as np
 import cv2
-import random
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 import json
-from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
-import matplotlib.pyplot as plt
+import functools
+import zlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import logging
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Crack geometry kernels. With numba they are compiled scalar loops, which
+# beat NumPy's per-call overhead at a few dozen points; without it they fall
+# back to the equivalent vectorized NumPy code.
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _jittered_polyline(start, offsets, step, limit, along_y):
+        """Crack polyline stepping `step` pixels per point, jittered across the step axis
+        
+        Point i lies `i * step` along the crack and `start + offsets[i]` across it,
+        clipped to [0, limit). Returns (x, y) points as int32.
+        """
+        num_points = offsets.shape[0]
+        points = np.empty((num_points, 2), dtype=np.int32)
+        for i in range(num_points):
+            across = min(max(start + offsets[i], 0), limit - 1)
+            if along_y:
+                points[i, 0] = across
+                points[i, 1] = i * step
+            else:
+                points[i, 0] = i * step
+                points[i, 1] = across
+        return points
+    
+    @njit(cache=True)
+    def _clipped_segments(center_x, center_y, offsets, width, height):
+        """Line segments around a center from (start_dx, start_dy, end_dx, end_dy) offset rows
+        
+        Endpoints are clipped to the image. Returns int32 segments shaped (n, 2, 2).
+        """
+        num_segments = offsets.shape[0]
+        segments = np.empty((num_segments, 2, 2), dtype=np.int32)
+        for i in range(num_segments):
+            for j in range(2):
+                segments[i, j, 0] = min(max(center_x + offsets[i, 2 * j], 0), width - 1)
+                segments[i, j, 1] = min(max(center_y + offsets[i, 2 * j + 1], 0), height - 1)
+        return segments
+    
+    # Compile the kernels at import so the first generated image doesn't pay for it
+    _jittered_polyline(0, np.zeros(1, dtype=np.int64), 1, 1, True)
+    _clipped_segments(0, 0, np.zeros((1, 4), dtype=np.int64), 1, 1)
+else:
+    def _jittered_polyline(start, offsets, step, limit, along_y):
+        """Crack polyline stepping `step` pixels per point, jittered across the step axis
+        
+        Point i lies `i * step` along the crack and `start + offsets[i]` across it,
+        clipped to [0, limit). Returns (x, y) points as int32.
+        """
+        along = np.arange(len(offsets)) * step
+        across = np.clip(start + offsets, 0, limit - 1)
+        columns = (across, along) if along_y else (along, across)
+        return np.stack(columns, axis=1).astype(np.int32)
+    
+    def _clipped_segments(center_x, center_y, offsets, width, height):
+        """Line segments around a center from (start_dx, start_dy, end_dx, end_dy) offset rows
+        
+        Endpoints are clipped to the image. Returns int32 segments shaped (n, 2, 2).
+        """
+        points = offsets.reshape(-1, 2, 2) + (center_x, center_y)
+        return np.clip(points, 0, (width - 1, height - 1)).astype(np.int32)
+
+def _draw_segments(img: np.ndarray, segments: np.ndarray, thickness: np.ndarray, color: Tuple[int, int, int]):
+    """Draw (n, 2, 2) int32 line segments with per-segment thickness
+    
+    All segments share one color, so draw order doesn't matter and segments
+    of equal thickness go to OpenCV in a single polylines call.
+    """
+    for line_width in np.unique(thickness).tolist():
+        cv2.polylines(img, list(segments[thickness == line_width]), False, color, line_width)
+
 class PavementDataGenerator:
     """
     Generate synthetic pavement data and augment real pavement images
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, base_tile_pool_size: int = 32):
         self.setup_logging()
         
+        # Pre-rendered base textures per (texture, size), cloned for each image
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self.base_tile_pool_size = base_tile_pool_size
+        self._base_tiles = {}
+        
+        # Pothole outline directions, one every 20 degrees
+        pothole_angles = np.radians(np.arange(0, 360, 20))
+        self._pothole_cos = np.cos(pothole_angles)
+        self._pothole_sin = np.sin(pothole_angles)
+        
+        # Per-thread scratch images reused across augmentations
+        self._aug_local = threading.local()
+        
         # Crack patterns for synthesis
         self.crack_patterns = {
             'longitudinal': self._generate_longitudinal_crack,
@@ -43,47 +133,72 @@ class PavementDataGenerator:
     def generate_synthetic_dataset(self, 
                                  output_dir: str, 
                                  num_samples_per_class: int = 1000,
-                                 image_size: Tuple[int, int] = (224, 224)) -> Dict:
-        """Generate complete synthetic pavement dataset"""
+                                 image_size: Tuple[int, int] = (224, 224),
+                                 num_workers: Optional[int] = None,
+                                 seed: Optional[int] = None,
+                                 image_format: str = 'png') -> Dict:
+        """Generate complete synthetic pavement dataset
+        
+        Images are generated in parallel worker processes. Each image gets its
+        own seed derived from `seed` (the generator's own seed by default), so a
+        seeded run is reproducible regardless of the number of workers. `image_format` is 'png' (lossless), 'jpg' or
+        'webp'; both lossy formats are about 5x smaller on disk, and jpg also
+        encodes faster than png.
+        """
+        
+        if image_format not in _IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+        extension, write_params = _IMAGE_FORMATS[image_format]
         
         self.logger.info(f"Generating synthetic dataset with {num_samples_per_class} samples per class")
         
-        # Create output directories
-        os.makedirs(output_dir, exist_ok=True)
-        
-        condition_dir = os.path.join(output_dir, "condition_assessment")
-        crack_dir = os.path.join(output_dir, "crack_detection")
-        
-        for dir_path in [condition_dir, crack_dir]:
-            os.makedirs(dir_path, exist_ok=True)
-        
-        # Generate condition assessment data
         condition_classes = ['excellent', 'good', 'fair', 'poor', 'failed']
-        for condition in condition_classes:
-            class_dir = os.path.join(condition_dir, condition)
-            os.makedirs(class_dir, exist_ok=True)
-            
-            for i in range(num_samples_per_class):
-                img = self._generate_condition_image(condition, image_size)
-                img_path = os.path.join(class_dir, f"{condition}_{i:05d}.png")
-                cv2.imwrite(img_path, img)
-        
-        # Generate crack detection data
         crack_classes = ['no_cracks', 'longitudinal', 'transverse', 'alligator', 'block', 'pothole']
-        for crack_type in crack_classes:
-            class_dir = os.path.join(crack_dir, crack_type)
+        class_dirs = [
+            ('condition', class_name, os.path.join(output_dir, "condition_assessment", class_name))
+            for class_name in condition_classes
+        ] + [
+            ('crack', class_name, os.path.join(output_dir, "crack_detection", class_name))
+            for class_name in crack_classes
+        ]
+        
+        # Create every output directory up front
+        for _, _, class_dir in class_dirs:
             os.makedirs(class_dir, exist_ok=True)
-            
-            for i in range(num_samples_per_class):
-                img = self._generate_crack_image(crack_type, image_size)
-                img_path = os.path.join(class_dir, f"{crack_type}_{i:05d}.png")
-                cv2.imwrite(img_path, img)
+        
+        # Seed each image task; workers share one base tile seed so their
+        # tile pools are identical
+        if seed is None:
+            seed = self.seed
+        tile_sequence, task_sequence = np.random.SeedSequence(seed).spawn(2)
+        tile_seed = int(tile_sequence.generate_state(1)[0])
+        seeds = iter(task_sequence.generate_state(len(class_dirs) * num_samples_per_class).tolist())
+        
+        # Build (kind, class, size, seed, path) tasks with fully joined paths
+        task_args = []
+        for kind, class_name, class_dir in class_dirs:
+            path_prefix = os.path.join(class_dir, class_name)
+            task_args.extend(
+                (kind, class_name, image_size, next(seeds), f"{path_prefix}_{i:05d}{extension}")
+                for i in range(num_samples_per_class)
+            )
+        
+        # Generate and write all images across worker processes
+        batches = [
+            task_args[start:start + _GENERATION_BATCH_SIZE]
+            for start in range(0, len(task_args), _GENERATION_BATCH_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=num_workers or os.cpu_count(),
+                                 initializer=_init_generation_worker,
+                                 initargs=(tile_seed, self.base_tile_pool_size)) as executor:
+            list(executor.map(functools.partial(_generate_image_batch, write_params=write_params), batches))
         
         # Generate metadata
         metadata = {
             'generation_date': datetime.now().isoformat(),
             'num_samples_per_class': num_samples_per_class,
             'image_size': image_size,
+            'image_format': image_format,
             'condition_classes': condition_classes,
             'crack_classes': crack_classes,
             'total_images': len(condition_classes) * num_samples_per_class + len(crack_classes) * num_samples_per_class
@@ -95,52 +210,96 @@ class PavementDataGenerator:
         self.logger.info(f"Synthetic dataset generated successfully in {output_dir}")
         return metadata
     
+    def _base_pavement_tile(self, 
+                            size: Tuple[int, int], 
+                            texture_type: str = 'asphalt') -> np.ndarray:
+        """Get a fresh base pavement image cloned from the cached tile pool
+        
+        The pool for each (texture, size) is rendered once, seeded from
+        `self.seed`. Each clone gets a random flip and a small brightness
+        shift so images drawn from the same tile still differ.
+        """
+        key = (texture_type, tuple(size))
+        pool = self._base_tiles.get(key)
+        if pool is None:
+            pool_seed = None if self.seed is None else [
+                self.seed, zlib.crc32(texture_type.encode()), *size
+            ]
+            pool_rng = np.random.default_rng(pool_seed)
+            pool = np.stack([
+                self._generate_base_pavement(size, texture_type, rng=pool_rng)
+                for _ in range(self.base_tile_pool_size)
+            ])
+            self._base_tiles[key] = pool
+        
+        tile = pool[self._rng.integers(len(pool))]
+        if self._rng.integers(2):
+            tile = tile[::-1]
+        if self._rng.integers(2):
+            tile = tile[:, ::-1]
+        img = tile.copy()
+        
+        shift = int(self._rng.integers(-5, 6))
+        cv2.add(img, (shift, shift, shift, 0), dst=img)
+        return img
+    
     def _generate_base_pavement(self, 
                               size: Tuple[int, int], 
-                              texture_type: str = 'asphalt') -> np.ndarray:
+                              texture_type: str = 'asphalt',
+                              rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """Generate base pavement texture"""
         
+        if rng is None:
+            rng = self._rng
         height, width = size
         
         if texture_type == 'asphalt':
             # Dark grey base with noise
-            base_color = np.random.randint(40, 80)
+            base_color = rng.integers(40, 80)
             img = np.full((height, width, 3), base_color, dtype=np.uint8)
             
             # Add texture noise
-            noise = np.random.randint(-20, 20, (height, width, 3))
-            img = np.clip(img + noise, 0, 255).astype(np.uint8)
+            self._add_texture_noise(img, rng, -20, 20)
             
-            # Add aggregate texture
-            for _ in range(width * height // 1000):
-                x = random.randint(0, width - 1)
-                y = random.randint(0, height - 1)
-                size = random.randint(1, 3)
-                color = random.randint(60, 120)
-                cv2.circle(img, (x, y), size, (color, color, color), -1)
+            # Add aggregate texture, sampling every speck in one batch
+            num_specks = width * height // 1000
+            xs = rng.integers(0, width, num_specks).tolist()
+            ys = rng.integers(0, height, num_specks).tolist()
+            radii = rng.integers(1, 4, num_specks).tolist()
+            colors = rng.integers(60, 121, num_specks).tolist()
+            for x, y, radius, color in zip(xs, ys, radii, colors):
+                cv2.circle(img, (x, y), radius, (color, color, color), -1)
                 
         elif texture_type == 'concrete':
             # Light grey base
-            base_color = np.random.randint(120, 180)
+            base_color = rng.integers(120, 180)
             img = np.full((height, width, 3), base_color, dtype=np.uint8)
             
             # Add concrete texture
-            noise = np.random.randint(-30, 30, (height, width, 3))
-            img = np.clip(img + noise, 0, 255).astype(np.uint8)
+            self._add_texture_noise(img, rng, -30, 30)
             
         else:
             # Default asphalt
-            base_color = np.random.randint(50, 90)
+            base_color = rng.integers(50, 90)
             img = np.full((height, width, 3), base_color, dtype=np.uint8)
-            noise = np.random.randint(-15, 15, (height, width, 3))
-            img = np.clip(img + noise, 0, 255).astype(np.uint8)
+            self._add_texture_noise(img, rng, -15, 15)
         
         return img
     
+    def _add_texture_noise(self, 
+                           img: np.ndarray, 
+                           rng: np.random.Generator, 
+                           low: int, 
+                           high: int):
+        """Add uniform noise in [low, high) to img in place with saturation"""
+        
+        noise = rng.integers(low, high, img.shape, dtype=np.int16)
+        cv2.add(img, noise, dst=img, dtype=cv2.CV_8U)
+    
     def _generate_condition_image(self, condition: str, size: Tuple[int, int]) -> np.ndarray:
         """Generate image for specific pavement condition"""
         
-        img = self._generate_base_pavement(size)
+        img = self._base_pavement_tile(size)
         
         if condition == 'excellent':
             # Minimal wear, good texture
@@ -171,7 +330,7 @@ class PavementDataGenerator:
     def _generate_crack_image(self, crack_type: str, size: Tuple[int, int]) -> np.ndarray:
         """Generate image with specific crack type"""
         
-        img = self._generate_base_pavement(size)
+        img = self._base_pavement_tile(size)
         
         if crack_type != 'no_cracks':
             crack_func = self.crack_patterns.get(crack_type)
@@ -185,110 +344,105 @@ class PavementDataGenerator:
         height, width = img.shape[:2]
         
         # Generate 1-3 longitudinal cracks
-        num_cracks = random.randint(1, 3)
+        num_cracks = int(self._rng.integers(1, 4))
         
         for _ in range(num_cracks):
             # Crack runs vertically with some variation
-            start_x = random.randint(width // 4, 3 * width // 4)
-            crack_width = random.randint(2, 6)
+            start_x = int(self._rng.integers(width // 4, 3 * width // 4 + 1))
+            crack_width = int(self._rng.integers(2, 7))
             
-            points = []
-            for y in range(0, height, 10):
-                x_offset = random.randint(-15, 15)
-                x = max(0, min(width - 1, start_x + x_offset))
-                points.append((x, y))
+            x_offsets = self._rng.integers(-15, 16, len(range(0, height, 10)))
+            points = _jittered_polyline(start_x, x_offsets, 10, width, True)
             
             # Draw crack
-            for i in range(len(points) - 1):
-                cv2.line(img, points[i], points[i + 1], (20, 20, 20), crack_width)
+            cv2.polylines(img, [points.reshape(-1, 1, 2)], False, (20, 20, 20), crack_width)
     
     def _generate_transverse_crack(self, img: np.ndarray):
         """Add transverse cracks (perpendicular to traffic direction)"""
         height, width = img.shape[:2]
         
         # Generate 1-2 transverse cracks
-        num_cracks = random.randint(1, 2)
+        num_cracks = int(self._rng.integers(1, 3))
         
         for _ in range(num_cracks):
             # Crack runs horizontally with some variation
-            start_y = random.randint(height // 4, 3 * height // 4)
-            crack_width = random.randint(2, 5)
+            start_y = int(self._rng.integers(height // 4, 3 * height // 4 + 1))
+            crack_width = int(self._rng.integers(2, 6))
             
-            points = []
-            for x in range(0, width, 10):
-                y_offset = random.randint(-10, 10)
-                y = max(0, min(height - 1, start_y + y_offset))
-                points.append((x, y))
+            y_offsets = self._rng.integers(-10, 11, len(range(0, width, 10)))
+            points = _jittered_polyline(start_y, y_offsets, 10, height, False)
             
             # Draw crack
-            for i in range(len(points) - 1):
-                cv2.line(img, points[i], points[i + 1], (15, 15, 15), crack_width)
+            cv2.polylines(img, [points.reshape(-1, 1, 2)], False, (15, 15, 15), crack_width)
     
     def _generate_alligator_crack(self, img: np.ndarray):
         """Add alligator/fatigue cracking (interconnected pattern)"""
         height, width = img.shape[:2]
         
         # Create interconnected crack pattern
-        center_x = random.randint(width // 4, 3 * width // 4)
-        center_y = random.randint(height // 4, 3 * height // 4)
+        center_x = int(self._rng.integers(width // 4, 3 * width // 4 + 1))
+        center_y = int(self._rng.integers(height // 4, 3 * height // 4 + 1))
         
         # Generate polygonal pattern
-        num_segments = random.randint(8, 15)
-        
-        for _ in range(num_segments):
-            # Random lines from center area
-            start_x = center_x + random.randint(-50, 50)
-            start_y = center_y + random.randint(-50, 50)
-            end_x = center_x + random.randint(-80, 80)
-            end_y = center_y + random.randint(-80, 80)
-            
-            # Ensure points are within bounds
-            start_x = max(0, min(width - 1, start_x))
-            start_y = max(0, min(height - 1, start_y))
-            end_x = max(0, min(width - 1, end_x))
-            end_y = max(0, min(height - 1, end_y))
-            
-            cv2.line(img, (start_x, start_y), (end_x, end_y), (25, 25, 25), random.randint(2, 4))
+        num_segments = int(self._rng.integers(8, 16))
+        
+        # Random lines from center area, clipped to the image
+        offsets = np.empty((num_segments, 4), dtype=np.int64)
+        offsets[:, :2] = self._rng.integers(-50, 51, (num_segments, 2))
+        offsets[:, 2:] = self._rng.integers(-80, 81, (num_segments, 2))
+        segments = _clipped_segments(center_x, center_y, offsets, width, height)
+        
+        _draw_segments(img, segments, self._rng.integers(2, 5, num_segments), (25, 25, 25))
     
     def _generate_block_crack(self, img: np.ndarray):
         """Add block cracking (rectangular pattern)"""
         height, width = img.shape[:2]
         
         # Create grid pattern
-        block_size_x = random.randint(30, 60)
-        block_size_y = random.randint(30, 60)
-        
-        # Vertical lines
-        for x in range(block_size_x, width, block_size_x):
-            x_var = x + random.randint(-5, 5)
-            cv2.line(img, (x_var, 0), (x_var, height), (20, 20, 20), random.randint(1, 3))
-        
-        # Horizontal lines
-        for y in range(block_size_y, height, block_size_y):
-            y_var = y + random.randint(-5, 5)
-            cv2.line(img, (0, y_var), (width, y_var), (20, 20, 20), random.randint(1, 3))
+        block_size_x = int(self._rng.integers(30, 61))
+        block_size_y = int(self._rng.integers(30, 61))
+        
+        # Jitter and thickness for every grid line, drawn in one batch each
+        xs = np.arange(block_size_x, width, block_size_x)
+        ys = np.arange(block_size_y, height, block_size_y)
+        centers = np.concatenate([xs, ys]) + self._rng.integers(-5, 6, len(xs) + len(ys))
+        thickness = self._rng.integers(1, 4, len(centers))
+        
+        # Expand each line into the pixel columns/rows its stroke covers;
+        # cv2.line paints 2 * thickness - 1 pixels across, centred on the line
+        band = np.arange(5)
+        coords = centers[:, None] - (thickness[:, None] - 1) + band
+        covered = band < 2 * thickness[:, None] - 1
+        
+        # Mark vertical lines as columns and horizontal lines as rows, then
+        # paint the whole grid in two broadcast writes
+        col_mask = np.zeros(width, dtype=bool)
+        row_mask = np.zeros(height, dtype=bool)
+        cols = coords[:len(xs)][covered[:len(xs)]]
+        rows = coords[len(xs):][covered[len(xs):]]
+        col_mask[cols[(cols >= 0) & (cols < width)]] = True
+        row_mask[rows[(rows >= 0) & (rows < height)]] = True
+        img[:, col_mask] = 20
+        img[row_mask] = 20
     
     def _generate_pothole(self, img: np.ndarray):
         """Add potholes"""
         height, width = img.shape[:2]
         
         # Generate 1-3 potholes
-        num_potholes = random.randint(1, 3)
+        num_potholes = int(self._rng.integers(1, 4))
         
-        for _ in range(num_potholes):
-            center_x = random.randint(30, width - 30)
-            center_y = random.randint(30, height - 30)
-            radius = random.randint(15, 35)
-            
+        centers_x = self._rng.integers(30, width - 29, num_potholes).tolist()
+        centers_y = self._rng.integers(30, height - 29, num_potholes).tolist()
+        base_radii = self._rng.integers(15, 36, num_potholes).tolist()
+        jitter = self._rng.integers(-8, 9, (num_potholes, len(self._pothole_cos)))
+        
+        for center_x, center_y, radius, radius_jitter in zip(centers_x, centers_y, base_radii, jitter):
             # Create irregular pothole shape
-            points = []
-            for angle in range(0, 360, 20):
-                r = radius + random.randint(-8, 8)
-                x = int(center_x + r * np.cos(np.radians(angle)))
-                y = int(center_y + r * np.sin(np.radians(angle)))
-                points.append([x, y])
-            
-            points = np.array(points, np.int32)
+            radii = radius + radius_jitter
+            points = np.empty((len(radii), 2), np.int32)
+            points[:, 0] = center_x + (radii * self._pothole_cos).astype(np.int32)
+            points[:, 1] = center_y + (radii * self._pothole_sin).astype(np.int32)
             
             # Fill pothole with dark color
             cv2.fillPoly(img, [points], (10, 10, 10))
@@ -296,114 +450,114 @@ class PavementDataGenerator:
             # Add depth effect
             cv2.ellipse(img, (center_x, center_y), (radius//2, radius//2), 0, 0, 360, (5, 5, 5), -1)
     
-    def _add_minor_wear(self, img: np.ndarray):
-        """Add minor wear patterns"""
+    def _darken_spots(self, img: np.ndarray, count: int, radius_range: Tuple[int, int], intensity):
+        """Darken `count` random filled spots of the pavement in place
+        
+        `radius_range` is inclusive; `intensity` is a scalar or per-spot array
+        giving how much each spot darkens the pixels it covers. Spots are drawn
+        into a single-channel mask and subtracted from the image in one
+        saturating pass.
+        """
         height, width = img.shape[:2]
         
+        xs = self._rng.integers(0, width, count).tolist()
+        ys = self._rng.integers(0, height, count).tolist()
+        radii = self._rng.integers(radius_range[0], radius_range[1] + 1, count).tolist()
+        intensities = np.broadcast_to(intensity, (count,)).tolist()
+        
+        mask = np.zeros((height, width), dtype=np.uint8)
+        for x, y, radius, amount in zip(xs, ys, radii, intensities):
+            cv2.circle(mask, (x, y), radius, int(amount), -1)
+        cv2.subtract(img, cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR), dst=img)
+    
+    def _add_minor_wear(self, img: np.ndarray):
+        """Add minor wear patterns"""
         # Light surface wear
-        for _ in range(random.randint(20, 50)):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            size = random.randint(3, 8)
-            cv2.circle(img, (x, y), size, (img[y,x] - 15).clip(0, 255), -1)
+        self._darken_spots(img, int(self._rng.integers(20, 51)), (3, 8), 15)
     
     def _add_minor_cracks(self, img: np.ndarray):
         """Add minor cracks"""
+        self._draw_random_cracks(img, int(self._rng.integers(2, 6)), (50, 20), (30, 30, 30), (1, 1))
+    
+    def _draw_random_cracks(self, 
+                            img: np.ndarray, 
+                            count: int, 
+                            reach: Tuple[int, int], 
+                            color: Tuple[int, int, int], 
+                            thickness_range: Tuple[int, int]):
+        """Draw `count` straight cracks from random starts
+        
+        Each crack ends up to `reach` (x, y) pixels from its start, clipped to
+        the image; `thickness_range` is inclusive. All endpoints and widths are
+        sampled in one batch.
+        """
         height, width = img.shape[:2]
         
-        for _ in range(random.randint(2, 5)):
-            start_x = random.randint(0, width)
-            start_y = random.randint(0, height)
-            end_x = start_x + random.randint(-50, 50)
-            end_y = start_y + random.randint(-20, 20)
-            
-            end_x = max(0, min(width - 1, end_x))
-            end_y = max(0, min(height - 1, end_y))
-            
-            cv2.line(img, (start_x, start_y), (end_x, end_y), (30, 30, 30), 1)
+        segments = np.empty((count, 2, 2), dtype=np.int32)
+        segments[:, 0] = self._rng.integers(0, (width + 1, height + 1), (count, 2))
+        segments[:, 1] = segments[:, 0] + self._rng.integers((-reach[0], -reach[1]), (reach[0] + 1, reach[1] + 1), (count, 2))
+        np.clip(segments[:, 1], 0, (width - 1, height - 1), out=segments[:, 1])
+        thickness = self._rng.integers(thickness_range[0], thickness_range[1] + 1, count)
+        
+        _draw_segments(img, segments, thickness, color)
     
     def _add_wear_patterns(self, img: np.ndarray):
         """Add moderate wear patterns"""
-        height, width = img.shape[:2]
-        
         # Surface texture loss
-        for _ in range(random.randint(50, 100)):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            size = random.randint(5, 15)
-            intensity = random.randint(10, 25)
-            cv2.circle(img, (x, y), size, (img[y,x] - intensity).clip(0, 255), -1)
+        count = int(self._rng.integers(50, 101))
+        self._darken_spots(img, count, (5, 15), self._rng.integers(10, 26, count))
     
     def _add_moderate_cracks(self, img: np.ndarray):
         """Add moderate cracking"""
         self._add_minor_cracks(img)
         
         # Additional larger cracks
-        for _ in range(random.randint(3, 7)):
-            start_x = random.randint(0, img.shape[1])
-            start_y = random.randint(0, img.shape[0])
-            end_x = start_x + random.randint(-80, 80)
-            end_y = start_y + random.randint(-40, 40)
-            
-            end_x = max(0, min(img.shape[1] - 1, end_x))
-            end_y = max(0, min(img.shape[0] - 1, end_y))
-            
-            cv2.line(img, (start_x, start_y), (end_x, end_y), (25, 25, 25), random.randint(2, 4))
+        self._draw_random_cracks(img, int(self._rng.integers(3, 8)), (80, 40), (25, 25, 25), (2, 4))
     
     def _add_surface_deterioration(self, img: np.ndarray):
         """Add surface deterioration"""
-        height, width = img.shape[:2]
-        
         # Aggregate loss
-        for _ in range(random.randint(100, 200)):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            size = random.randint(8, 20)
-            cv2.circle(img, (x, y), size, (img[y,x] - 30).clip(0, 255), -1)
+        self._darken_spots(img, int(self._rng.integers(100, 201)), (8, 20), 30)
     
     def _add_severe_cracks(self, img: np.ndarray):
         """Add severe cracking"""
         self._add_moderate_cracks(img)
         
         # Wide, deep cracks
-        for _ in range(random.randint(5, 10)):
-            start_x = random.randint(0, img.shape[1])
-            start_y = random.randint(0, img.shape[0])
-            end_x = start_x + random.randint(-100, 100)
-            end_y = start_y + random.randint(-60, 60)
-            
-            end_x = max(0, min(img.shape[1] - 1, end_x))
-            end_y = max(0, min(img.shape[0] - 1, end_y))
-            
-            cv2.line(img, (start_x, start_y), (end_x, end_y), (15, 15, 15), random.randint(4, 8))
+        self._draw_random_cracks(img, int(self._rng.integers(5, 11)), (100, 60), (15, 15, 15), (4, 8))
     
     def _add_potholes(self, img: np.ndarray):
         """Add multiple potholes"""
-        for _ in range(random.randint(1, 4)):
+        for _ in range(int(self._rng.integers(1, 5))):
             self._generate_pothole(img)
     
     def _add_severe_deterioration(self, img: np.ndarray):
         """Add severe surface deterioration"""
-        height, width = img.shape[:2]
-        
         # Extensive aggregate loss and surface damage
-        for _ in range(random.randint(200, 400)):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            size = random.randint(10, 30)
-            cv2.circle(img, (x, y), size, (img[y,x] - 40).clip(0, 255), -1)
+        self._darken_spots(img, int(self._rng.integers(200, 401)), (10, 30), 40)
     
-    def augment_real_data(self, input_dir: str, output_dir: str, augmentation_factor: int = 5):
-        """Augment real pavement data with various transformations"""
+    def augment_real_data(self, 
+                          input_dir: str, 
+                          output_dir: str, 
+                          augmentation_factor: int = 5,
+                          num_workers: Optional[int] = None):
+        """Augment real pavement data with various transformations
+        
+        Source images are processed concurrently on a thread pool; OpenCV
+        releases the GIL while decoding, transforming and encoding. Each
+        source gets its own seed drawn up front, so a seeded generator
+        produces the same output regardless of thread scheduling.
+        """
         
         self.logger.info(f"Augmenting real data from {input_dir}")
         
         os.makedirs(output_dir, exist_ok=True)
         
-        # Process each subdirectory
+        # Collect every source image, creating the mirrored output directories
+        tasks = []
         for root, dirs, files in os.walk(input_dir):
             for file in files:
-                if file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                if file.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
                     img_path = os.path.join(root, file)
                     
                     # Maintain directory structure
@@ -411,57 +565,151 @@ class PavementDataGenerator:
                     out_dir = os.path.join(output_dir, rel_path)
                     os.makedirs(out_dir, exist_ok=True)
                     
-                    # Load original image
-                    img = cv2.imread(img_path)
-                    if img is None:
-                        continue
-                    
-                    # Copy original
                     base_name = os.path.splitext(file)[0]
-                    cv2.imwrite(os.path.join(out_dir, f"{base_name}_original.png"), img)
-                    
-                    # Generate augmented versions
-                    for i in range(augmentation_factor):
-                        aug_img = self._apply_augmentations(img.copy())
-                        cv2.imwrite(os.path.join(out_dir, f"{base_name}_aug_{i:03d}.png"), aug_img)
+                    tasks.append((img_path, out_dir, base_name))
+        
+        seeds = self._rng.integers(0, 2**63, len(tasks))
+        with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+            list(executor.map(
+                lambda task, seed: self._augment_source(*task, augmentation_factor, seed),
+                tasks, seeds.tolist()
+            ))
         
         self.logger.info(f"Data augmentation completed. Output saved to {output_dir}")
     
-    def _apply_augmentations(self, img: np.ndarray) -> np.ndarray:
-        """Apply random augmentations to an image"""
-        
-        # Brightness adjustment
-        if random.random() < 0.5:
-            factor = random.uniform(0.7, 1.3)
-            img = cv2.convertScaleAbs(img, alpha=factor, beta=0)
-        
-        # Contrast adjustment
-        if random.random() < 0.5:
-            factor = random.uniform(0.8, 1.2)
-            img = cv2.convertScaleAbs(img, alpha=factor, beta=0)
+    def _augment_source(self, img_path: str, out_dir: str, base_name: str, augmentation_factor: int, seed: int):
+        """Write the original and `augmentation_factor` augmented copies of one source image"""
+        
+        # Load original image
+        img = cv2.imread(img_path)
+        if img is None:
+            return
+        
+        # Copy original
+        cv2.imwrite(os.path.join(out_dir, f"{base_name}_original.png"), img)
+        
+        # Generate augmented versions into a reused scratch image
+        rng = np.random.default_rng(seed)
+        scratch = self._aug_buffer('augmented', img)
+        for i in range(augmentation_factor):
+            aug_img = self._apply_augmentations(img, scratch, rng)
+            cv2.imwrite(os.path.join(out_dir, f"{base_name}_aug_{i:03d}.png"), aug_img)
+    
+    def _aug_buffer(self, name: str, like: np.ndarray, dtype=None) -> np.ndarray:
+        """Get this thread's reusable scratch image `name` shaped like `like` (dtype defaults to like's)
+        
+        Each thread keeps one buffer per name, reallocated when the requested
+        shape or dtype changes, so mixed image sizes do not accumulate buffers.
+        """
+        buffers = getattr(self._aug_local, 'buffers', None)
+        if buffers is None:
+            buffers = self._aug_local.buffers = {}
+        dtype = np.dtype(dtype or like.dtype)
+        buf = buffers.get(name)
+        if buf is None or buf.shape != like.shape or buf.dtype != dtype:
+            buf = buffers[name] = np.empty_like(like, dtype=dtype)
+        return buf
+    
+    def _apply_augmentations(self, 
+                             src: np.ndarray, 
+                             dst: Optional[np.ndarray] = None,
+                             rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Apply random augmentations to an image
+        
+        `src` is left untouched; the result is written into `dst` (allocated
+        if not given) and returned. Randomness comes from `rng`, defaulting
+        to the generator's own. Brightness and contrast are both pure
+        scalings, so they are combined into one convertScaleAbs pass; rotation
+        and flip are composed into a single affine warp.
+        """
+        
+        if dst is None:
+            dst = np.empty_like(src)
+        if rng is None:
+            rng = self._rng
+        np.copyto(dst, src)
+        
+        # Brightness and contrast adjustment
+        alpha = 1.0
+        if rng.random() < 0.5:
+            alpha *= rng.uniform(0.7, 1.3)
+        if rng.random() < 0.5:
+            alpha *= rng.uniform(0.8, 1.2)
+        if alpha != 1.0:
+            cv2.convertScaleAbs(dst, dst=dst, alpha=alpha, beta=0)
         
         # Gaussian noise
-        if random.random() < 0.3:
-            noise = np.random.normal(0, random.uniform(5, 15), img.shape)
-            img = np.clip(img + noise, 0, 255).astype(np.uint8)
+        if rng.random() < 0.3:
+            sigma = rng.uniform(5, 15)
+            noise = self._aug_buffer('noise', dst, np.int16)
+            # OpenCV's per-thread RNG is reseeded from rng to stay reproducible
+            cv2.setRNGSeed(int(rng.integers(2**31)))
+            cv2.randn(noise, (0, 0, 0), (sigma, sigma, sigma))
+            cv2.add(dst, noise, dst=dst, dtype=cv2.CV_8U)
         
         # Blur
-        if random.random() < 0.2:
-            ksize = random.choice([3, 5])
-            img = cv2.GaussianBlur(img, (ksize, ksize), 0)
-        
-        # Rotation (small angles)
-        if random.random() < 0.4:
-            angle = random.uniform(-10, 10)
-            center = (img.shape[1] // 2, img.shape[0] // 2)
-            M = cv2.getRotationMatrix2D(center, angle, 1.0)
-            img = cv2.warpAffine(img, M, (img.shape[1], img.shape[0]))
-        
-        # Horizontal flip
-        if random.random() < 0.5:
-            img = cv2.flip(img, 1)
-        
-        return img
+        if rng.random() < 0.2:
+            ksize = int(rng.choice([3, 5]))
+            cv2.GaussianBlur(dst, (ksize, ksize), 0, dst=dst)
+        
+        # Rotation (small angles) and horizontal flip
+        height, width = dst.shape[:2]
+        rotate = rng.random() < 0.4
+        if rotate:
+            angle = rng.uniform(-10, 10)
+            M = cv2.getRotationMatrix2D((width // 2, height // 2), angle, 1.0)
+        flip = rng.random() < 0.5
+        
+        if rotate:
+            if flip:
+                # Mirror the rotated x coordinate: x' = (width - 1) - x
+                M[0] = -M[0]
+                M[0, 2] += width - 1
+            # warpAffine can't run in place, so warp via a second scratch image
+            warped = self._aug_buffer('warped', dst)
+            cv2.warpAffine(dst, M, (width, height), dst=warped)
+            np.copyto(dst, warped)
+        elif flip:
+            cv2.flip(dst, 1, dst=dst)
+        
+        return dst
+
+# Images per worker-process batch, and writer threads overlapping encode with generation
+_GENERATION_BATCH_SIZE = 64
+_WRITER_THREADS = 2
+
+# Output encodings for synthetic datasets: file extension and cv2.imwrite params
+_IMAGE_FORMATS = {
+    'png': ('.png', []),
+    'jpg': ('.jpg', [cv2.IMWRITE_JPEG_QUALITY, 92]),
+    'webp': ('.webp', [cv2.IMWRITE_WEBP_QUALITY, 90]),
+}
+
+# Per-process generator used by synthetic dataset worker processes
+_worker_generator = None
+
+def _init_generation_worker(tile_seed: int, base_tile_pool_size: int):
+    """Create the worker's generator and keep OpenCV to one thread per process"""
+    global _worker_generator
+    cv2.setNumThreads(1)
+    _worker_generator = PavementDataGenerator(seed=tile_seed, base_tile_pool_size=base_tile_pool_size)
+
+def _generate_image_batch(batch: List[Tuple[str, str, Tuple[int, int], int, str]], write_params: List[int]):
+    """Generate a batch of seeded synthetic images, encoding and writing them on background threads"""
+    with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as writer:
+        writes = []
+        for kind, class_name, size, seed, img_path in batch:
+            _worker_generator._rng = np.random.default_rng(seed)
+            
+            if kind == 'condition':
+                img = _worker_generator._generate_condition_image(class_name, size)
+            else:
+                img = _worker_generator._generate_crack_image(class_name, size)
+            writes.append(writer.submit(cv2.imwrite, img_path, img, write_params))
+        
+        # Surface any write errors from the writer threads
+        for write in writes:
+            write.result()
 
 if __name__ == "__main__":
     generator = PavementDataGenerator()
@@ -6,23 +6,121 @@ Advanced evaluation and visualization system for pavement AI models
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 import seaborn as sns
 from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score,
-    classification_report, confusion_matrix, roc_curve, auc,
-    precision_recall_curve, average_precision_score,
-    cohen_kappa_score, matthews_corrcoef, log_loss
+    auc,
+    precision_recall_curve, average_precision_score, log_loss
 )
-from sklearn.preprocessing import LabelBinarizer
 import tensorflow as tf
 from typing import Dict, List, Tuple, Optional, Any
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json for the report file
+    orjson = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Critical misclassification counters, in the order of _CRITICAL_ERROR_KEYS.
+# With numba the rules run as one compiled pass over the samples; without it
+# each rule is an independent NumPy mask.
+_CRITICAL_ERROR_KEYS = (
+    # Critical underestimation (dangerous)
+    'failed_classified_as_good',
+    'poor_classified_as_excellent',
+    
+    # Critical overestimation (wasteful)
+    'good_classified_as_failed',
+    'excellent_classified_as_poor'
+)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_critical(y_true, y_pred):
+        """Count each critical misclassification rule in a single pass"""
+        failed_as_good = 0
+        poor_as_excellent = 0
+        good_as_failed = 0
+        excellent_as_poor = 0
+        for i in range(y_true.shape[0]):
+            true_label = y_true[i]
+            pred_label = y_pred[i]
+            if true_label == 4 and pred_label <= 1:
+                failed_as_good += 1
+            elif true_label == 3 and pred_label == 0:
+                poor_as_excellent += 1
+            elif true_label <= 1 and pred_label == 4:
+                good_as_failed += 1
+            elif true_label == 0 and pred_label == 3:
+                excellent_as_poor += 1
+        
+        counts = np.empty(4, dtype=np.int64)
+        counts[0] = failed_as_good
+        counts[1] = poor_as_excellent
+        counts[2] = good_as_failed
+        counts[3] = excellent_as_poor
+        return counts
+else:
+    def _count_critical(y_true, y_pred):
+        """Count each critical misclassification rule as an independent mask"""
+        return np.array([
+            np.count_nonzero((y_true == 4) & (y_pred <= 1)),
+            np.count_nonzero((y_true == 3) & (y_pred == 0)),
+            np.count_nonzero((y_true <= 1) & (y_pred == 4)),
+            np.count_nonzero((y_true == 0) & (y_pred == 3))
+        ], dtype=np.int64)
+
+# Inference batch size for evaluate_model; large batches keep the accelerator
+# busy instead of paying per-batch Python overhead on Keras' default of 32
+_PREDICT_BATCH_SIZE = 256
+
+# Maintenance urgency code (low, medium, high, critical) for each condition label
+_URGENCY_LUT = np.array([
+    0,  # excellent -> low
+    0,  # good -> low
+    1,  # fair -> medium
+    2,  # poor -> high
+    3   # failed -> critical
+])
+
+# Hypothetical cost matrix (cost of treating condition X as condition Y)
+# Rows: true condition, Columns: predicted condition
+_COST_MATRIX = np.array([
+    [0, 50, 100, 500, 1000],      # excellent misclassified as...
+    [100, 0, 50, 400, 900],       # good misclassified as...
+    [300, 100, 0, 200, 700],      # fair misclassified as...
+    [800, 500, 300, 0, 300],      # poor misclassified as...
+    [2000, 1500, 1000, 500, 0]   # failed misclassified as...
+])
+
+# Plot output: PNG encoding cost scales with dpi^2, so the evaluation plots
+# use a moderate dpi (a little higher for the annotated confusion matrix) and
+# fast zlib compression
+_PLOT_DPI = 150
+_CONFUSION_MATRIX_DPI = 200
+_PNG_COMPRESS_LEVEL = 1
+
+# Heatmaps with more classes than this are drawn without per-cell value text
+_MAX_ANNOTATED_CLASSES = 8
+
+def _defined_mean(values) -> float:
+    """Mean of the non-NaN values, or NaN when none are defined"""
+    values = np.asarray(values, dtype=np.float64)
+    defined = values[~np.isnan(values)]
+    return float(defined.mean()) if defined.size else float('nan')
+
 class PavementEvaluationMetrics:
     """
     Comprehensive evaluation metrics for pavement condition analysis models
@@ -52,27 +150,59 @@ class PavementEvaluationMetrics:
         
         # Get predictions if not provided
         if y_pred_proba is None:
-            y_pred_proba = model.predict(X_test)
-        
-        y_pred = np.argmax(y_pred_proba, axis=1)
+            dataset = (tf.data.Dataset.from_tensor_slices(X_test)
+                       .batch(_PREDICT_BATCH_SIZE)
+                       .prefetch(tf.data.AUTOTUNE))
+            y_pred_proba = model.predict(dataset, verbose=0)
+            del dataset
+        
+        # Only the predictions are used from here on
+        del X_test
+        
+        # log_loss clips by the input dtype's eps, so it gets the probabilities
+        # at their original precision
+        log_loss_proba = y_pred_proba
+        
+        # Fix the dtypes at the boundary: float32 probabilities and int32 labels
+        # halve the bytes read by every O(N·K) and O(N) pass below
+        y_pred_proba = np.ascontiguousarray(y_pred_proba, dtype=np.float32)
+        y_test = np.ascontiguousarray(y_test, dtype=np.int32)
+        y_pred = np.argmax(y_pred_proba, axis=1).astype(np.int32)
+        
+        # Per-sample confidence and correctness, shared by the confidence
+        # analysis and plots
+        max_probs = y_pred_proba.max(axis=1)
+        correct = y_test == y_pred
+        
+        # Confusion counts shared by all count-based metrics: indexed by label,
+        # and restricted to the labels that occur (sklearn's layout)
+        label_counts = self._label_count_matrix(y_test, y_pred, y_pred_proba.shape[1])
+        conf_matrix = self._confusion_matrix(label_counts)
         
         # Basic metrics
-        basic_metrics = self._calculate_basic_metrics(y_test, y_pred, y_pred_proba)
+        basic_metrics = self._calculate_basic_metrics(conf_matrix, y_test, log_loss_proba)
+        del log_loss_proba
         
         # Per-class metrics
-        per_class_metrics = self._calculate_per_class_metrics(y_test, y_pred)
+        per_class_metrics = self._calculate_per_class_metrics(conf_matrix, y_test, y_pred)
+        
+        # One-hot labels and per-class ROC curves, shared by the curve-based
+        # metrics and plots
+        y_true_bin = self._binarize_labels(y_test, y_pred_proba.shape[1])
+        roc_curves = self._roc_curves(y_true_bin, y_pred_proba)
         
         # Advanced metrics
-        advanced_metrics = self._calculate_advanced_metrics(y_test, y_pred, y_pred_proba)
+        advanced_metrics = self._calculate_advanced_metrics(y_test, y_pred_proba, max_probs, correct, y_true_bin, roc_curves)
         
         # Threshold analysis
-        threshold_analysis = self._analyze_thresholds(y_test, y_pred_proba)
+        threshold_analysis = self._analyze_thresholds(y_true_bin, y_pred_proba)
         
         # Generate visualizations
-        self._generate_visualizations(y_test, y_pred, y_pred_proba, save_dir)
+        self._generate_visualizations(y_test, y_pred, y_pred_proba, max_probs, correct, label_counts, conf_matrix,
+                                     y_true_bin, roc_curves, save_dir)
         
         # Pavement-specific analysis
-        pavement_analysis = self._pavement_specific_analysis(y_test, y_pred, y_pred_proba)
+        pavement_analysis = self._pavement_specific_analysis(y_test, y_pred, y_pred_proba, label_counts)
         
         # Compile results
         evaluation_results = {
@@ -90,43 +220,121 @@ class PavementEvaluationMetrics:
         
         return evaluation_results
     
+    def _label_count_matrix(self, y_true: np.ndarray, y_pred: np.ndarray, num_classes: int) -> np.ndarray:
+        """Count matrix C[true, pred] indexed directly by label, from a single bincount"""
+        num_classes = max(num_classes, int(y_true.max()) + 1, int(y_pred.max()) + 1)
+        counts = np.bincount(y_true * num_classes + y_pred, minlength=num_classes * num_classes)
+        return counts.reshape(num_classes, num_classes)
+    
+    def _confusion_matrix(self, label_counts: np.ndarray) -> np.ndarray:
+        """Confusion matrix over the labels present in y_true or y_pred
+        
+        Rows and columns of labels that never occur are dropped to match
+        sklearn's `confusion_matrix`.
+        """
+        present = (label_counts.sum(axis=0) + label_counts.sum(axis=1)) > 0
+        return label_counts[present][:, present]
+    
+    def _confusion_matrix_rates(self, conf_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-class counts, precision, recall and F1 from a confusion matrix (0 where undefined)"""
+        
+        tp = np.diag(conf_matrix).astype(float)
+        support = conf_matrix.sum(axis=1)
+        predicted = conf_matrix.sum(axis=0)
+        
+        precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+        denominator = precision + recall
+        f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(tp), where=denominator > 0)
+        
+        return {
+            'tp': tp,
+            'support': support,
+            'predicted': predicted,
+            'precision': precision,
+            'recall': recall,
+            'f1': f1
+        }
+    
     def _calculate_basic_metrics(self, 
+                                conf_matrix: np.ndarray,
                                 y_true: np.ndarray, 
-                                y_pred: np.ndarray,
                                 y_pred_proba: np.ndarray) -> Dict:
-        """Calculate basic classification metrics"""
+        """Calculate basic classification metrics from the confusion matrix"""
+        
+        rates = self._confusion_matrix_rates(conf_matrix)
+        support = rates['support']
+        predicted = rates['predicted']
+        total = conf_matrix.sum()
+        correct = rates['tp'].sum()
+        
+        # Single-label multi-class: micro precision, recall and F1 all equal accuracy
+        accuracy = correct / total
+        
+        # Chance agreement from the row/column marginals
+        expected_agreement = np.dot(support, predicted) / total ** 2
+        cohen_kappa = (accuracy - expected_agreement) / (1 - expected_agreement) if expected_agreement != 1 else 0.0
+        
+        # Multi-class MCC in closed form from the marginals
+        mcc_denominator = np.sqrt(
+            float(total ** 2 - np.dot(predicted, predicted)) * float(total ** 2 - np.dot(support, support))
+        )
+        mcc = (correct * total - np.dot(support, predicted)) / mcc_denominator if mcc_denominator > 0 else 0.0
+        
+        def weighted(values):
+            return float(np.dot(values, support) / total)
         
         return {
-            'accuracy': accuracy_score(y_true, y_pred),
-            'precision_macro': precision_score(y_true, y_pred, average='macro'),
-            'precision_micro': precision_score(y_true, y_pred, average='micro'),
-            'precision_weighted': precision_score(y_true, y_pred, average='weighted'),
-            'recall_macro': recall_score(y_true, y_pred, average='macro'),
-            'recall_micro': recall_score(y_true, y_pred, average='micro'),
-            'recall_weighted': recall_score(y_true, y_pred, average='weighted'),
-            'f1_macro': f1_score(y_true, y_pred, average='macro'),
-            'f1_micro': f1_score(y_true, y_pred, average='micro'),
-            'f1_weighted': f1_score(y_true, y_pred, average='weighted'),
+            'accuracy': float(accuracy),
+            'precision_macro': float(rates['precision'].mean()),
+            'precision_micro': float(accuracy),
+            'precision_weighted': weighted(rates['precision']),
+            'recall_macro': float(rates['recall'].mean()),
+            'recall_micro': float(accuracy),
+            'recall_weighted': weighted(rates['recall']),
+            'f1_macro': float(rates['f1'].mean()),
+            'f1_micro': float(accuracy),
+            'f1_weighted': weighted(rates['f1']),
             'log_loss': log_loss(y_true, y_pred_proba),
-            'cohen_kappa': cohen_kappa_score(y_true, y_pred),
-            'matthews_corrcoef': matthews_corrcoef(y_true, y_pred)
+            'cohen_kappa': float(cohen_kappa),
+            'matthews_corrcoef': float(mcc)
+        }
+    
+    def _classification_report(self, conf_matrix: np.ndarray) -> Dict:
+        """`classification_report(output_dict=True)` equivalent built from the confusion matrix
+        
+        Keys follow sklearn's schema: one entry per class, then 'accuracy',
+        'macro avg' and 'weighted avg'. Undefined precision/recall are 0.
+        """
+        rates = self._confusion_matrix_rates(conf_matrix)
+        support = rates['support']
+        total = int(support.sum())
+        scores = np.stack([rates['precision'], rates['recall'], rates['f1']])
+        
+        def entry(precision, recall, f1, count):
+            return {'precision': precision, 'recall': recall, 'f1-score': f1, 'support': count}
+        
+        report = {
+            class_name: entry(*class_scores, count)
+            for class_name, class_scores, count in zip(
+                self.class_names[:len(conf_matrix)], scores.T.tolist(), support.tolist()
+            )
         }
+        report['accuracy'] = float(rates['tp'].sum() / total)
+        report['macro avg'] = entry(*scores.mean(axis=1).tolist(), total)
+        report['weighted avg'] = entry(*(scores @ support / total).tolist(), total)
+        return report
     
     def _calculate_per_class_metrics(self, 
+                                   conf_matrix: np.ndarray,
                                    y_true: np.ndarray, 
                                    y_pred: np.ndarray) -> Dict:
         """Calculate per-class metrics"""
         
         # Classification report
-        class_report = classification_report(
-            y_true, y_pred, 
-            target_names=self.class_names[:len(np.unique(y_true))],
-            output_dict=True
-        )
+        class_report = self._classification_report(conf_matrix)
         
         # Per-class confusion matrix analysis
-        conf_matrix = confusion_matrix(y_true, y_pred)
-        
         per_class_analysis = {}
         for i, class_name in enumerate(self.class_names[:len(np.unique(y_true))]):
             if i < len(conf_matrix):
@@ -158,100 +366,166 @@ class PavementEvaluationMetrics:
         return {
             'classification_report': class_report,
             'per_class_analysis': per_class_analysis,
-            'confusion_matrix': conf_matrix.tolist()
+            'confusion_matrix': conf_matrix
         }
     
+    def _binarize_labels(self, y_true: np.ndarray, num_classes: int) -> np.ndarray:
+        """One-hot encode labels, one column per class index (including binary problems)"""
+        num_classes = max(num_classes, int(y_true.max()) + 1)
+        return np.eye(num_classes, dtype=np.uint8)[y_true]
+    
+    def _roc_curves(self, y_true_bin: np.ndarray, y_pred_proba: np.ndarray) -> Dict[str, Dict]:
+        """Per-class ROC curves (fpr, tpr, auc) from one column-wise sort
+        
+        All class columns are ranked by descending score in a single argsort;
+        TPR/FPR at each distinct threshold are cumulative label counts at the
+        end of each run of tied scores. Classes without both positives and
+        negatives get NaN curves.
+        """
+        class_names = self.class_names[:min(len(self.class_names), y_pred_proba.shape[1], y_true_bin.shape[1])]
+        num_classes = len(class_names)
+        y_scores = y_pred_proba[:, :num_classes]
+        
+        order = np.argsort(-y_scores, axis=0, kind='mergesort')
+        sorted_scores = np.take_along_axis(y_scores, order, axis=0)
+        true_positives = np.cumsum(np.take_along_axis(y_true_bin[:, :num_classes], order, axis=0), axis=0)
+        false_positives = np.arange(1, len(y_scores) + 1)[:, None] - true_positives
+        
+        curves = {}
+        for i, class_name in enumerate(class_names):
+            positives = true_positives[-1, i]
+            negatives = false_positives[-1, i]
+            if positives == 0 or negatives == 0:
+                curves[class_name] = {'fpr': np.array([np.nan]), 'tpr': np.array([np.nan]), 'auc': float('nan')}
+                continue
+            
+            threshold_ends = np.r_[np.flatnonzero(np.diff(sorted_scores[:, i])), len(y_scores) - 1]
+            fpr = np.r_[0, false_positives[threshold_ends, i]] / negatives
+            tpr = np.r_[0, true_positives[threshold_ends, i]] / positives
+            curves[class_name] = {'fpr': fpr, 'tpr': tpr, 'auc': float(auc(fpr, tpr))}
+        
+        return curves
+    
     def _calculate_advanced_metrics(self, 
                                   y_true: np.ndarray, 
-                                  y_pred: np.ndarray,
-                                  y_pred_proba: np.ndarray) -> Dict:
+                                  y_pred_proba: np.ndarray,
+                                  max_probs: np.ndarray,
+                                  correct: np.ndarray,
+                                  y_true_bin: np.ndarray,
+                                  roc_curves: Dict[str, Dict]) -> Dict:
         """Calculate advanced metrics including ROC-AUC and PR-AUC"""
         
         advanced_metrics = {}
         
         # Multi-class ROC-AUC
         try:
-            # Binarize labels for multi-class ROC
-            lb = LabelBinarizer()
-            y_true_bin = lb.fit_transform(y_true)
-            
-            if y_true_bin.shape[1] == 1:  # Binary case
-                y_true_bin = np.hstack([1 - y_true_bin, y_true_bin])
+            # PR-AUC (average precision) for all classes at once. Average
+            # precision is the step-wise PR area; trapezoidal auc() over the
+            # PR curve overestimates it.
+            class_names = self.class_names[:min(y_pred_proba.shape[1], y_true_bin.shape[1])]
+            num_classes = len(class_names)
+            y_true_bin = y_true_bin[:, :num_classes]
+            y_scores = y_pred_proba[:, :num_classes]
             
-            # Calculate ROC-AUC for each class
-            roc_auc_scores = {}
-            pr_auc_scores = {}
+            # Classes with only one label value have undefined AUCs
+            positives = y_true_bin.sum(axis=0)
+            defined = (positives > 0) & (positives < len(y_true_bin))
+            pr_auc = np.full(num_classes, np.nan)
+            if defined.any():
+                pr_auc[defined] = np.atleast_1d(average_precision_score(y_true_bin[:, defined], y_scores[:, defined], average=None))
             
-            for i, class_name in enumerate(self.class_names[:y_pred_proba.shape[1]]):
-                if i < y_true_bin.shape[1]:
-                    # ROC-AUC
-                    fpr, tpr, _ = roc_curve(y_true_bin[:, i], y_pred_proba[:, i])
-                    roc_auc_scores[class_name] = auc(fpr, tpr)
-                    
-                    # Precision-Recall AUC
-                    precision, recall, _ = precision_recall_curve(y_true_bin[:, i], y_pred_proba[:, i])
-                    pr_auc_scores[class_name] = auc(recall, precision)
+            roc_auc_scores = {class_name: curve['auc'] for class_name, curve in roc_curves.items()}
+            pr_auc_scores = dict(zip(class_names, pr_auc.tolist()))
             
             advanced_metrics['roc_auc_per_class'] = roc_auc_scores
             advanced_metrics['pr_auc_per_class'] = pr_auc_scores
-            advanced_metrics['roc_auc_macro'] = np.mean(list(roc_auc_scores.values()))
-            advanced_metrics['pr_auc_macro'] = np.mean(list(pr_auc_scores.values()))
+            # Macro averages over the classes whose AUC is defined
+            advanced_metrics['roc_auc_macro'] = _defined_mean(list(roc_auc_scores.values()))
+            advanced_metrics['pr_auc_macro'] = _defined_mean(list(pr_auc_scores.values()))
             
         except Exception as e:
             print(f"Warning: Could not calculate ROC-AUC metrics: {e}")
             advanced_metrics['roc_auc_error'] = str(e)
         
         # Top-k accuracy
-        advanced_metrics['top_2_accuracy'] = self._top_k_accuracy(y_true, y_pred_proba, k=2)
-        advanced_metrics['top_3_accuracy'] = self._top_k_accuracy(y_true, y_pred_proba, k=3)
+        top_k = self._top_k_accuracies(y_true, y_pred_proba, ks=(2, 3))
+        advanced_metrics['top_2_accuracy'] = top_k[2]
+        advanced_metrics['top_3_accuracy'] = top_k[3]
         
         # Confidence analysis
-        confidence_analysis = self._analyze_prediction_confidence(y_true, y_pred, y_pred_proba)
+        confidence_analysis = self._analyze_prediction_confidence(max_probs, correct)
         advanced_metrics['confidence_analysis'] = confidence_analysis
         
         return advanced_metrics
     
     def _top_k_accuracy(self, y_true: np.ndarray, y_pred_proba: np.ndarray, k: int) -> float:
         """Calculate top-k accuracy"""
-        top_k_predictions = np.argsort(y_pred_proba, axis=1)[:, -k:]
-        correct = 0
-        for i, true_label in enumerate(y_true):
-            if true_label in top_k_predictions[i]:
-                correct += 1
-        return correct / len(y_true)
+        return self._top_k_accuracies(y_true, y_pred_proba, ks=(k,))[k]
     
-    def _analyze_prediction_confidence(self, 
-                                     y_true: np.ndarray, 
-                                     y_pred: np.ndarray,
-                                     y_pred_proba: np.ndarray) -> Dict:
-        """Analyze prediction confidence patterns"""
+    def _top_k_accuracies(self, y_true: np.ndarray, y_pred_proba: np.ndarray, ks: Tuple[int, ...]) -> Dict[int, float]:
+        """Calculate top-k accuracy for several k from a single argpartition
         
-        max_probs = np.max(y_pred_proba, axis=1)
-        correct_predictions = (y_true == y_pred)
+        Partitioning at every -k places each k-th largest score in its sorted
+        position, so the last k columns are exactly the top k for every k.
+        """
+        num_classes = y_pred_proba.shape[1]
+        kth = sorted({-min(k, num_classes) for k in ks})
+        top = np.argpartition(y_pred_proba, kth, axis=1)
+        hits = top == y_true.astype(np.int64)[:, None]
+        return {
+            k: float(hits[:, -min(k, num_classes):].any(axis=1).mean())
+            for k in ks
+        }
+    
+    def _accuracy_above_thresholds(self, 
+                                   max_probs: np.ndarray, 
+                                   correct: np.ndarray, 
+                                   thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample count and accuracy among predictions with confidence >= each threshold
+        
+        Confidences are sorted once; each threshold is then a binary search
+        into the sorted array plus a lookup into the running correct count.
+        Accuracy is 0 where no prediction reaches the threshold.
+        """
+        order = np.argsort(max_probs, kind='stable')
+        sorted_probs = max_probs[order]
+        correct_suffix = np.concatenate([[0], np.cumsum(correct[order][::-1])])[::-1]
+        
+        start = np.searchsorted(sorted_probs, thresholds, side='left')
+        counts = len(sorted_probs) - start
+        accuracies = np.divide(correct_suffix[start], counts, out=np.zeros(len(counts)), where=counts > 0)
+        return counts, accuracies
+    
+    def _analyze_prediction_confidence(self, 
+                                     max_probs: np.ndarray, 
+                                     correct_predictions: np.ndarray) -> Dict:
+        """Analyze prediction confidence patterns from per-sample confidence and correctness"""
         
-        # Confidence statistics
+        # Confidence statistics, splitting the confidences by correctness once
+        confidence_correct = max_probs[correct_predictions]
+        confidence_incorrect = max_probs[~correct_predictions]
         confidence_stats = {
-            'mean_confidence_correct': np.mean(max_probs[correct_predictions]),
-            'mean_confidence_incorrect': np.mean(max_probs[~correct_predictions]),
-            'std_confidence_correct': np.std(max_probs[correct_predictions]),
-            'std_confidence_incorrect': np.std(max_probs[~correct_predictions]),
-            'median_confidence_correct': np.median(max_probs[correct_predictions]),
-            'median_confidence_incorrect': np.median(max_probs[~correct_predictions])
+            'mean_confidence_correct': np.mean(confidence_correct),
+            'mean_confidence_incorrect': np.mean(confidence_incorrect),
+            'std_confidence_correct': np.std(confidence_correct),
+            'std_confidence_incorrect': np.std(confidence_incorrect),
+            'median_confidence_correct': np.median(confidence_correct),
+            'median_confidence_incorrect': np.median(confidence_incorrect)
         }
         
         # Confidence-based accuracy at different thresholds
         thresholds = [0.5, 0.6, 0.7, 0.8, 0.9]
-        confidence_accuracy = {}
-        
-        for threshold in thresholds:
-            high_conf_mask = max_probs >= threshold
-            if np.sum(high_conf_mask) > 0:
-                high_conf_accuracy = np.mean(correct_predictions[high_conf_mask])
-                confidence_accuracy[f'accuracy_at_{threshold}'] = {
-                    'accuracy': high_conf_accuracy,
-                    'samples': int(np.sum(high_conf_mask)),
-                    'percentage_samples': np.sum(high_conf_mask) / len(y_true) * 100
-                }
+        counts, accuracies = self._accuracy_above_thresholds(max_probs, correct_predictions, np.array(thresholds))
+        
+        confidence_accuracy = {
+            f'accuracy_at_{threshold}': {
+                'accuracy': float(accuracy),
+                'samples': int(count),
+                'percentage_samples': count / len(max_probs) * 100
+            }
+            for threshold, count, accuracy in zip(thresholds, counts.tolist(), accuracies.tolist())
+            if count > 0
+        }
         
         return {
             'confidence_statistics': confidence_stats,
@@ -259,21 +533,15 @@ class PavementEvaluationMetrics:
         }
     
     def _analyze_thresholds(self, 
-                          y_true: np.ndarray, 
+                          y_true_bin: np.ndarray, 
                           y_pred_proba: np.ndarray) -> Dict:
         """Analyze optimal thresholds for each class"""
         
         threshold_analysis = {}
         
-        # Binarize for threshold analysis
-        lb = LabelBinarizer()
-        y_true_bin = lb.fit_transform(y_true)
-        
-        if y_true_bin.shape[1] == 1:  # Binary case
-            y_true_bin = np.hstack([1 - y_true_bin, y_true_bin])
-        
         for i, class_name in enumerate(self.class_names[:min(len(self.class_names), y_pred_proba.shape[1])]):
-            if i < y_true_bin.shape[1]:
+            # Classes absent from the test set have no PR curve
+            if y_true_bin[:, i].any():
                 # Calculate precision-recall curve
                 precision, recall, thresholds = precision_recall_curve(
                     y_true_bin[:, i], y_pred_proba[:, i]
@@ -295,7 +563,8 @@ class PavementEvaluationMetrics:
     def _pavement_specific_analysis(self, 
                                   y_true: np.ndarray, 
                                   y_pred: np.ndarray,
-                                  y_pred_proba: np.ndarray) -> Dict:
+                                  y_pred_proba: np.ndarray,
+                                  label_counts: np.ndarray) -> Dict:
         """Pavement-specific analysis and insights"""
         
         analysis = {}
@@ -310,11 +579,11 @@ class PavementEvaluationMetrics:
         analysis['critical_misclassifications'] = critical_errors
         
         # Maintenance priority analysis
-        maintenance_analysis = self._maintenance_priority_analysis(y_true, y_pred, y_pred_proba)
+        maintenance_analysis = self._maintenance_priority_analysis(label_counts)
         analysis['maintenance_priority'] = maintenance_analysis
         
         # Economic impact analysis
-        economic_impact = self._calculate_economic_impact(y_true, y_pred)
+        economic_impact = self._calculate_economic_impact(label_counts, len(y_true))
         analysis['economic_impact'] = economic_impact
         
         return analysis
@@ -325,136 +594,79 @@ class PavementEvaluationMetrics:
                                 severity_mapping: Dict) -> Dict:
         """Analyze how far off predictions are in terms of severity"""
         
-        severity_errors = {
-            'off_by_one': 0,
-            'off_by_two': 0,
-            'off_by_more': 0,
-            'overestimation': 0,
-            'underestimation': 0
-        }
+        differences = y_pred.astype(np.int32) - y_true.astype(np.int32)
+        abs_differences = np.abs(differences)
         
-        differences = y_pred - y_true
-        
-        for diff in differences:
-            abs_diff = abs(diff)
-            if abs_diff == 1:
-                severity_errors['off_by_one'] += 1
-            elif abs_diff == 2:
-                severity_errors['off_by_two'] += 1
-            elif abs_diff > 2:
-                severity_errors['off_by_more'] += 1
-            
-            if diff > 0:
-                severity_errors['overestimation'] += 1
-            elif diff < 0:
-                severity_errors['underestimation'] += 1
+        severity_counts = {
+            'off_by_one': int(np.count_nonzero(abs_differences == 1)),
+            'off_by_two': int(np.count_nonzero(abs_differences == 2)),
+            'off_by_more': int(np.count_nonzero(abs_differences > 2)),
+            'overestimation': int(np.count_nonzero(differences > 0)),
+            'underestimation': int(np.count_nonzero(differences < 0))
+        }
         
         # Convert to percentages
         total_samples = len(y_true)
-        for key in severity_errors:
-            severity_errors[key] = {
-                'count': severity_errors[key],
-                'percentage': severity_errors[key] / total_samples * 100
-            }
-        
-        return severity_errors
+        return {
+            key: {'count': count, 'percentage': count / total_samples * 100}
+            for key, count in severity_counts.items()
+        }
     
     def _identify_critical_errors(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict:
         """Identify critical misclassifications that could lead to safety issues"""
         
-        critical_errors = {
-            'failed_classified_as_good': 0,
-            'poor_classified_as_excellent': 0,
-            'good_classified_as_failed': 0,
-            'excellent_classified_as_poor': 0
-        }
-        
-        for true_label, pred_label in zip(y_true, y_pred):
-            # Critical underestimation (dangerous)
-            if true_label == 4 and pred_label <= 1:  # Failed classified as excellent/good
-                critical_errors['failed_classified_as_good'] += 1
-            elif true_label == 3 and pred_label == 0:  # Poor classified as excellent
-                critical_errors['poor_classified_as_excellent'] += 1
-            
-            # Critical overestimation (wasteful)
-            elif true_label <= 1 and pred_label == 4:  # Good/excellent classified as failed
-                critical_errors['good_classified_as_failed'] += 1
-            elif true_label == 0 and pred_label == 3:  # Excellent classified as poor
-                critical_errors['excellent_classified_as_poor'] += 1
+        critical_counts = _count_critical(np.ascontiguousarray(y_true), np.ascontiguousarray(y_pred))
         
         total_samples = len(y_true)
-        for key in critical_errors:
-            critical_errors[key] = {
-                'count': critical_errors[key],
-                'percentage': critical_errors[key] / total_samples * 100
-            }
-        
-        return critical_errors
-    
-    def _maintenance_priority_analysis(self, 
-                                     y_true: np.ndarray, 
-                                     y_pred: np.ndarray,
-                                     y_pred_proba: np.ndarray) -> Dict:
-        """Analyze how well the model prioritizes maintenance needs"""
-        
-        # Define maintenance urgency levels
-        urgency_levels = {
-            0: 'low',      # excellent
-            1: 'low',      # good  
-            2: 'medium',   # fair
-            3: 'high',     # poor
-            4: 'critical'  # failed
+        return {
+            key: {'count': int(count), 'percentage': int(count) / total_samples * 100}
+            for key, count in zip(_CRITICAL_ERROR_KEYS, critical_counts)
         }
+    
+    def _maintenance_priority_analysis(self, label_counts: np.ndarray) -> Dict:
+        """Analyze how well the model prioritizes maintenance needs from the label count matrix"""
+        
+        urgency_names = ['low', 'medium', 'high', 'critical']
         
-        true_urgency = [urgency_levels[label] for label in y_true]
-        pred_urgency = [urgency_levels[label] for label in y_pred]
+        # Fold the label counts into urgency x urgency counts
+        urgency_onehot = np.eye(len(urgency_names), dtype=label_counts.dtype)[_URGENCY_LUT[:len(label_counts)]]
+        urgency_counts = urgency_onehot.T @ label_counts @ urgency_onehot
+        true_counts = urgency_counts.sum(axis=1)
+        pred_counts = urgency_counts.sum(axis=0)
         
         urgency_accuracy = {}
-        for urgency in ['low', 'medium', 'high', 'critical']:
-            true_mask = np.array(true_urgency) == urgency
-            if np.sum(true_mask) > 0:
-                pred_mask = np.array(pred_urgency) == urgency
-                accuracy = np.sum(true_mask & pred_mask) / np.sum(true_mask)
+        for code, urgency in enumerate(urgency_names):
+            if true_counts[code] > 0:
                 urgency_accuracy[urgency] = {
-                    'accuracy': accuracy,
-                    'true_count': int(np.sum(true_mask)),
-                    'predicted_count': int(np.sum(pred_mask))
+                    'accuracy': urgency_counts[code, code] / true_counts[code],
+                    'true_count': int(true_counts[code]),
+                    'predicted_count': int(pred_counts[code])
                 }
         
         return {
             'urgency_level_accuracy': urgency_accuracy
         }
     
-    def _calculate_economic_impact(self, y_true: np.ndarray, y_pred: np.ndarray) -> Dict:
-        """Calculate economic impact of misclassifications"""
-        
-        # Hypothetical cost matrix (cost of treating condition X as condition Y)
-        # Rows: true condition, Columns: predicted condition
-        cost_matrix = np.array([
-            [0, 50, 100, 500, 1000],      # excellent misclassified as...
-            [100, 0, 50, 400, 900],       # good misclassified as...
-            [300, 100, 0, 200, 700],      # fair misclassified as...
-            [800, 500, 300, 0, 300],      # poor misclassified as...
-            [2000, 1500, 1000, 500, 0]   # failed misclassified as...
-        ])
-        
-        total_cost = 0
-        cost_breakdown = {}
-        
-        for true_label, pred_label in zip(y_true, y_pred):
-            if true_label < len(cost_matrix) and pred_label < len(cost_matrix[0]):
-                cost = cost_matrix[true_label, pred_label]
-                total_cost += cost
-                
-                key = f"true_{true_label}_pred_{pred_label}"
-                if key not in cost_breakdown:
-                    cost_breakdown[key] = {'count': 0, 'total_cost': 0}
-                cost_breakdown[key]['count'] += 1
-                cost_breakdown[key]['total_cost'] += cost
+    def _calculate_economic_impact(self, label_counts: np.ndarray, total_samples: int) -> Dict:
+        """Calculate economic impact of misclassifications from the label count matrix"""
+        
+        # Only labels covered by the cost matrix carry a cost
+        size = min(len(_COST_MATRIX), len(label_counts))
+        counts = label_counts[:size, :size]
+        costs = _COST_MATRIX[:size, :size]
+        
+        total_cost = int(np.einsum('ij,ij->', counts, costs))
+        cost_breakdown = {
+            f"true_{true_label}_pred_{pred_label}": {
+                'count': int(counts[true_label, pred_label]),
+                'total_cost': int(counts[true_label, pred_label] * costs[true_label, pred_label])
+            }
+            for true_label, pred_label in zip(*np.nonzero(counts))
+        }
         
         return {
             'total_economic_impact': total_cost,
-            'average_cost_per_sample': total_cost / len(y_true),
+            'average_cost_per_sample': total_cost / total_samples,
             'cost_breakdown': cost_breakdown
         }
     
@@ -462,63 +674,88 @@ class PavementEvaluationMetrics:
                                y_true: np.ndarray, 
                                y_pred: np.ndarray,
                                y_pred_proba: np.ndarray,
+                               max_probs: np.ndarray,
+                               correct: np.ndarray,
+                               label_counts: np.ndarray,
+                               conf_matrix: np.ndarray,
+                               y_true_bin: np.ndarray,
+                               roc_curves: Dict[str, Dict],
                                save_dir: str):
-        """Generate comprehensive visualizations"""
-        
-        # Set style
-        plt.style.use('default')
-        sns.set_palette("husl")
+        """Generate comprehensive visualizations
         
-        # 1. Confusion Matrix
-        self._plot_confusion_matrix(y_true, y_pred, save_dir)
-        
-        # 2. Per-class metrics
-        self._plot_per_class_metrics(y_true, y_pred, save_dir)
-        
-        # 3. ROC Curves
-        self._plot_roc_curves(y_true, y_pred_proba, save_dir)
-        
-        # 4. Precision-Recall Curves
-        self._plot_precision_recall_curves(y_true, y_pred_proba, save_dir)
+        Each plot draws on its own Figure (no pyplot state), so the plots are
+        rendered and saved concurrently on a thread pool.
+        """
         
-        # 5. Prediction confidence distribution
-        self._plot_confidence_distribution(y_true, y_pred, y_pred_proba, save_dir)
+        # Set style (global, so before any plot starts)
+        matplotlib.style.use('default')
+        sns.set_palette("husl")
         
-        # 6. Error analysis
-        self._plot_error_analysis(y_true, y_pred, save_dir)
+        plots = [
+            # 1. Confusion Matrix
+            (self._plot_confusion_matrix, conf_matrix, y_true, save_dir),
+            
+            # 2. Per-class metrics
+            (self._plot_per_class_metrics, y_true, y_pred, save_dir),
+            
+            # 3. ROC Curves
+            (self._plot_roc_curves, roc_curves, save_dir),
+            
+            # 4. Precision-Recall Curves
+            (self._plot_precision_recall_curves, y_true_bin, y_pred_proba, save_dir),
+            
+            # 5. Prediction confidence distribution
+            (self._plot_confidence_distribution, y_true, max_probs, correct, save_dir),
+            
+            # 6. Error analysis
+            (self._plot_error_analysis, y_true, y_pred, label_counts, save_dir),
+            
+            # 7. Pavement-specific visualizations
+            (self._plot_pavement_analysis, y_true, y_pred, max_probs, label_counts, save_dir)
+        ]
         
-        # 7. Pavement-specific visualizations
-        self._plot_pavement_analysis(y_true, y_pred, y_pred_proba, save_dir)
+        with ThreadPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(*plot) for plot in plots]
+            for future in futures:
+                future.result()
     
-    def _plot_confusion_matrix(self, y_true: np.ndarray, y_pred: np.ndarray, save_dir: str):
-        """Plot enhanced confusion matrix"""
+    def _save_figure(self, fig: Figure, save_dir: str, filename: str, dpi: int = _PLOT_DPI):
+        """Save a laid-out figure as PNG without a tight-bbox measuring pass"""
+        fig.savefig(os.path.join(save_dir, filename), dpi=dpi,
+                    pil_kwargs={'compress_level': _PNG_COMPRESS_LEVEL})
+    
+    def _plot_confusion_matrix(self, conf_matrix: np.ndarray, y_true: np.ndarray, save_dir: str):
+        """Plot enhanced confusion matrix from the precomputed counts"""
         
-        conf_matrix = confusion_matrix(y_true, y_pred)
+        # Normalize confusion matrix by row; rows without samples stay at 0
+        row_sums = conf_matrix.sum(axis=1, keepdims=True)
+        conf_matrix_norm = np.divide(conf_matrix, row_sums,
+                                     out=np.zeros(conf_matrix.shape, dtype=np.float32),
+                                     where=row_sums > 0)
         
-        # Normalize confusion matrix
-        conf_matrix_norm = conf_matrix.astype('float') / conf_matrix.sum(axis=1)[:, np.newaxis]
+        tick_labels = self.class_names[:len(np.unique(y_true))]
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig = Figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Raw counts
         sns.heatmap(conf_matrix, annot=True, fmt='d', cmap='Blues', ax=ax1,
-                   xticklabels=self.class_names[:len(np.unique(y_true))],
-                   yticklabels=self.class_names[:len(np.unique(y_true))])
+                   xticklabels=tick_labels,
+                   yticklabels=tick_labels)
         ax1.set_title('Confusion Matrix (Counts)')
         ax1.set_xlabel('Predicted')
         ax1.set_ylabel('Actual')
         
         # Normalized
         sns.heatmap(conf_matrix_norm, annot=True, fmt='.2f', cmap='Blues', ax=ax2,
-                   xticklabels=self.class_names[:len(np.unique(y_true))],
-                   yticklabels=self.class_names[:len(np.unique(y_true))])
+                   xticklabels=tick_labels,
+                   yticklabels=tick_labels)
         ax2.set_title('Confusion Matrix (Normalized)')
         ax2.set_xlabel('Predicted')
         ax2.set_ylabel('Actual')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(save_dir, 'confusion_matrix.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, save_dir, 'confusion_matrix.png', dpi=_CONFUSION_MATRIX_DPI)
     
     def _plot_per_class_metrics(self, y_true: np.ndarray, y_pred: np.ndarray, save_dir: str):
         """Plot per-class performance metrics"""
@@ -532,287 +769,223 @@ class PavementEvaluationMetrics:
         classes = self.class_names[:len(precision)]
         x_pos = np.arange(len(classes))
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-        
-        # Precision
-        bars1 = ax1.bar(x_pos, precision, alpha=0.8, color='skyblue')
-        ax1.set_xlabel('Class')
-        ax1.set_ylabel('Precision')
-        ax1.set_title('Precision by Class')
-        ax1.set_xticks(x_pos)
-        ax1.set_xticklabels(classes, rotation=45)
-        ax1.set_ylim(0, 1)
-        
-        # Add value labels
-        for bar, val in zip(bars1, precision):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                    f'{val:.3f}', ha='center', va='bottom')
-        
-        # Recall
-        bars2 = ax2.bar(x_pos, recall, alpha=0.8, color='lightcoral')
-        ax2.set_xlabel('Class')
-        ax2.set_ylabel('Recall')
-        ax2.set_title('Recall by Class')
-        ax2.set_xticks(x_pos)
-        ax2.set_xticklabels(classes, rotation=45)
-        ax2.set_ylim(0, 1)
-        
-        for bar, val in zip(bars2, recall):
-            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                    f'{val:.3f}', ha='center', va='bottom')
-        
-        # F1-Score
-        bars3 = ax3.bar(x_pos, f1, alpha=0.8, color='lightgreen')
-        ax3.set_xlabel('Class')
-        ax3.set_ylabel('F1-Score')
-        ax3.set_title('F1-Score by Class')
-        ax3.set_xticks(x_pos)
-        ax3.set_xticklabels(classes, rotation=45)
-        ax3.set_ylim(0, 1)
-        
-        for bar, val in zip(bars3, f1):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                    f'{val:.3f}', ha='center', va='bottom')
-        
-        # Support
-        bars4 = ax4.bar(x_pos, support, alpha=0.8, color='gold')
-        ax4.set_xlabel('Class')
-        ax4.set_ylabel('Support (Count)')
-        ax4.set_title('Support by Class')
-        ax4.set_xticks(x_pos)
-        ax4.set_xticklabels(classes, rotation=45)
-        
-        for bar, val in zip(bars4, support):
-            ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                    f'{int(val)}', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(save_dir, 'per_class_metrics.png'), dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    def _plot_roc_curves(self, y_true: np.ndarray, y_pred_proba: np.ndarray, save_dir: str):
-        """Plot ROC curves for each class"""
+        fig = Figure(figsize=(15, 10))
+        axes = fig.subplots(2, 2).ravel()
         
-        try:
-            from sklearn.preprocessing import LabelBinarizer
-            
-            lb = LabelBinarizer()
-            y_true_bin = lb.fit_transform(y_true)
-            
-            if y_true_bin.shape[1] == 1:
-                y_true_bin = np.hstack([1 - y_true_bin, y_true_bin])
+        # (metric, y label, values, color, value label format, y limit)
+        panels = [
+            ('Precision', 'Precision', precision, 'skyblue', '%.3f', (0, 1)),
+            ('Recall', 'Recall', recall, 'lightcoral', '%.3f', (0, 1)),
+            ('F1-Score', 'F1-Score', f1, 'lightgreen', '%.3f', (0, 1)),
+            ('Support', 'Support (Count)', support, 'gold', '%d', None)
+        ]
+        
+        for ax, (metric_name, ylabel, values, color, fmt, ylim) in zip(axes, panels):
+            bars = ax.bar(x_pos, values, alpha=0.8, color=color)
+            ax.set_xlabel('Class')
+            ax.set_ylabel(ylabel)
+            ax.set_title(f'{metric_name} by Class')
+            ax.set_xticks(x_pos)
+            ax.set_xticklabels(classes, rotation=45)
+            if ylim is not None:
+                ax.set_ylim(*ylim)
             
-            plt.figure(figsize=(10, 8))
+            # Add value labels
+            ax.bar_label(bars, fmt=fmt, padding=3)
+        
+        fig.tight_layout()
+        self._save_figure(fig, save_dir, 'per_class_metrics.png')
+    
+    def _plot_roc_curves(self, roc_curves: Dict[str, Dict], save_dir: str):
+        """Plot precomputed ROC curves for each class"""
+        
+        try:
+            fig = Figure(figsize=(10, 8))
+            ax = fig.subplots()
             
-            for i, class_name in enumerate(self.class_names[:min(len(self.class_names), y_pred_proba.shape[1])]):
-                if i < y_true_bin.shape[1]:
-                    fpr, tpr, _ = roc_curve(y_true_bin[:, i], y_pred_proba[:, i])
-                    roc_auc = auc(fpr, tpr)
-                    
-                    plt.plot(fpr, tpr, linewidth=2, 
-                            label=f'{class_name} (AUC = {roc_auc:.3f})')
+            for class_name, curve in roc_curves.items():
+                ax.plot(curve['fpr'], curve['tpr'], linewidth=2, 
+                        label=f'{class_name} (AUC = {curve["auc"]:.3f})')
             
-            plt.plot([0, 1], [0, 1], 'k--', linewidth=2, label='Random')
-            plt.xlim([0.0, 1.0])
-            plt.ylim([0.0, 1.05])
-            plt.xlabel('False Positive Rate')
-            plt.ylabel('True Positive Rate')
-            plt.title('ROC Curves by Class')
-            plt.legend(loc="lower right")
-            plt.grid(True)
+            ax.plot([0, 1], [0, 1], 'k--', linewidth=2, label='Random')
+            ax.set_xlim([0.0, 1.0])
+            ax.set_ylim([0.0, 1.05])
+            ax.set_xlabel('False Positive Rate')
+            ax.set_ylabel('True Positive Rate')
+            ax.set_title('ROC Curves by Class')
+            ax.legend(loc="lower right")
+            ax.grid(True)
             
-            plt.savefig(os.path.join(save_dir, 'roc_curves.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            self._save_figure(fig, save_dir, 'roc_curves.png')
             
         except Exception as e:
             print(f"Warning: Could not plot ROC curves: {e}")
     
-    def _plot_precision_recall_curves(self, y_true: np.ndarray, y_pred_proba: np.ndarray, save_dir: str):
+    def _plot_precision_recall_curves(self, y_true_bin: np.ndarray, y_pred_proba: np.ndarray, save_dir: str):
         """Plot Precision-Recall curves for each class"""
         
         try:
-            from sklearn.preprocessing import LabelBinarizer
-            
-            lb = LabelBinarizer()
-            y_true_bin = lb.fit_transform(y_true)
-            
-            if y_true_bin.shape[1] == 1:
-                y_true_bin = np.hstack([1 - y_true_bin, y_true_bin])
-            
-            plt.figure(figsize=(10, 8))
+            fig = Figure(figsize=(10, 8))
+            ax = fig.subplots()
             
             for i, class_name in enumerate(self.class_names[:min(len(self.class_names), y_pred_proba.shape[1])]):
-                if i < y_true_bin.shape[1]:
+                if y_true_bin[:, i].any():
                     precision, recall, _ = precision_recall_curve(y_true_bin[:, i], y_pred_proba[:, i])
                     avg_precision = average_precision_score(y_true_bin[:, i], y_pred_proba[:, i])
                     
-                    plt.plot(recall, precision, linewidth=2,
+                    ax.plot(recall, precision, linewidth=2,
                             label=f'{class_name} (AP = {avg_precision:.3f})')
             
-            plt.xlim([0.0, 1.0])
-            plt.ylim([0.0, 1.05])
-            plt.xlabel('Recall')
-            plt.ylabel('Precision')
-            plt.title('Precision-Recall Curves by Class')
-            plt.legend(loc="lower left")
-            plt.grid(True)
+            ax.set_xlim([0.0, 1.0])
+            ax.set_ylim([0.0, 1.05])
+            ax.set_xlabel('Recall')
+            ax.set_ylabel('Precision')
+            ax.set_title('Precision-Recall Curves by Class')
+            ax.legend(loc="lower left")
+            ax.grid(True)
             
-            plt.savefig(os.path.join(save_dir, 'precision_recall_curves.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            self._save_figure(fig, save_dir, 'precision_recall_curves.png')
             
         except Exception as e:
             print(f"Warning: Could not plot PR curves: {e}")
     
     def _plot_confidence_distribution(self, 
                                     y_true: np.ndarray, 
-                                    y_pred: np.ndarray,
-                                    y_pred_proba: np.ndarray,
+                                    max_probs: np.ndarray,
+                                    correct: np.ndarray,
                                     save_dir: str):
         """Plot prediction confidence distributions"""
         
-        max_probs = np.max(y_pred_proba, axis=1)
-        correct = y_true == y_pred
-        
-        plt.figure(figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Subplot 1: Overall confidence distribution
-        plt.subplot(2, 2, 1)
-        plt.hist(max_probs[correct], bins=30, alpha=0.7, label='Correct', color='green')
-        plt.hist(max_probs[~correct], bins=30, alpha=0.7, label='Incorrect', color='red')
-        plt.xlabel('Prediction Confidence')
-        plt.ylabel('Frequency')
-        plt.title('Confidence Distribution by Correctness')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax1.hist(max_probs[correct], bins=30, alpha=0.7, label='Correct', color='green')
+        ax1.hist(max_probs[~correct], bins=30, alpha=0.7, label='Incorrect', color='red')
+        ax1.set_xlabel('Prediction Confidence')
+        ax1.set_ylabel('Frequency')
+        ax1.set_title('Confidence Distribution by Correctness')
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
         
         # Subplot 2: Confidence vs Accuracy
-        plt.subplot(2, 2, 2)
         conf_bins = np.linspace(0, 1, 11)
-        bin_accuracies = []
-        bin_counts = []
+        num_bins = len(conf_bins) - 1
         
-        for i in range(len(conf_bins) - 1):
-            mask = (max_probs >= conf_bins[i]) & (max_probs < conf_bins[i + 1])
-            if np.sum(mask) > 0:
-                bin_accuracies.append(np.mean(correct[mask]))
-                bin_counts.append(np.sum(mask))
-            else:
-                bin_accuracies.append(0)
-                bin_counts.append(0)
+        # Half-open bins [lo, hi); a confidence of exactly 1.0 falls past the last bin
+        bin_index = np.digitize(max_probs, conf_bins) - 1
+        bin_counts = np.bincount(bin_index, minlength=num_bins + 1)[:num_bins]
+        bin_correct = np.bincount(bin_index, weights=correct, minlength=num_bins + 1)[:num_bins]
+        bin_accuracies = np.divide(bin_correct, bin_counts, out=np.zeros(num_bins), where=bin_counts > 0)
         
         bin_centers = (conf_bins[:-1] + conf_bins[1:]) / 2
-        plt.plot(bin_centers, bin_accuracies, 'o-', linewidth=2, markersize=8)
-        plt.plot([0, 1], [0, 1], 'k--', alpha=0.5, label='Perfect Calibration')
-        plt.xlabel('Confidence')
-        plt.ylabel('Accuracy')
-        plt.title('Confidence vs Accuracy (Calibration)')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        
-        # Subplot 3: Per-class confidence
-        plt.subplot(2, 2, 3)
-        class_confidences = []
-        class_labels = []
-        
-        for class_idx in range(len(self.class_names[:len(np.unique(y_true))])):
-            mask = y_true == class_idx
-            if np.sum(mask) > 0:
-                class_confidences.extend(max_probs[mask])
-                class_labels.extend([self.class_names[class_idx]] * np.sum(mask))
-        
-        if class_confidences:
+        ax2.plot(bin_centers, bin_accuracies, 'o-', linewidth=2, markersize=8)
+        ax2.plot([0, 1], [0, 1], 'k--', alpha=0.5, label='Perfect Calibration')
+        ax2.set_xlabel('Confidence')
+        ax2.set_ylabel('Accuracy')
+        ax2.set_title('Confidence vs Accuracy (Calibration)')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+        
+        # Subplot 3: Per-class confidence, gathering every sample's class name at once
+        class_counts = np.bincount(y_true)
+        num_named = min(len(self.class_names), np.count_nonzero(class_counts))
+        present = np.flatnonzero(class_counts[:num_named])
+        
+        if len(present) > 0:
+            named = y_true < num_named
+            class_names = np.asarray(self.class_names[:num_named])
             df_conf = pd.DataFrame({
-                'confidence': class_confidences,
-                'class': class_labels
+                'confidence': max_probs[named],
+                'class': class_names[y_true[named]]
             })
-            sns.boxplot(data=df_conf, x='class', y='confidence')
-            plt.xticks(rotation=45)
-            plt.title('Confidence Distribution by Class')
-            plt.ylabel('Prediction Confidence')
+            sns.boxplot(data=df_conf, x='class', y='confidence', order=class_names[present].tolist(), ax=ax3)
+            ax3.tick_params(axis='x', rotation=45)
+            ax3.set_title('Confidence Distribution by Class')
+            ax3.set_ylabel('Prediction Confidence')
         
         # Subplot 4: Confidence threshold analysis
-        plt.subplot(2, 2, 4)
         thresholds = np.linspace(0.1, 0.9, 9)
-        accuracies = []
-        coverages = []
-        
-        for threshold in thresholds:
-            high_conf_mask = max_probs >= threshold
-            if np.sum(high_conf_mask) > 0:
-                accuracies.append(np.mean(correct[high_conf_mask]))
-                coverages.append(np.sum(high_conf_mask) / len(max_probs))
-            else:
-                accuracies.append(0)
-                coverages.append(0)
+        counts, accuracies = self._accuracy_above_thresholds(max_probs, correct, thresholds)
+        coverages = counts / len(max_probs)
         
-        ax = plt.gca()
-        ax2 = ax.twinx()
+        ax4_coverage = ax4.twinx()
         
-        line1 = ax.plot(thresholds, accuracies, 'b-o', label='Accuracy')
-        line2 = ax2.plot(thresholds, coverages, 'r-s', label='Coverage')
+        line1 = ax4.plot(thresholds, accuracies, 'b-o', label='Accuracy')
+        line2 = ax4_coverage.plot(thresholds, coverages, 'r-s', label='Coverage')
         
-        ax.set_xlabel('Confidence Threshold')
-        ax.set_ylabel('Accuracy', color='b')
-        ax2.set_ylabel('Coverage', color='r')
-        ax.set_title('Accuracy vs Coverage by Threshold')
+        ax4.set_xlabel('Confidence Threshold')
+        ax4.set_ylabel('Accuracy', color='b')
+        ax4_coverage.set_ylabel('Coverage', color='r')
+        ax4.set_title('Accuracy vs Coverage by Threshold')
         
         lines = line1 + line2
         labels = [l.get_label() for l in lines]
-        ax.legend(lines, labels, loc='center right')
+        ax4.legend(lines, labels, loc='center right')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(save_dir, 'confidence_analysis.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, save_dir, 'confidence_analysis.png')
     
-    def _plot_error_analysis(self, y_true: np.ndarray, y_pred: np.ndarray, save_dir: str):
+    def _plot_error_analysis(self, 
+                           y_true: np.ndarray, 
+                           y_pred: np.ndarray,
+                           label_counts: np.ndarray,
+                           save_dir: str):
         """Plot error analysis visualizations"""
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig = Figure(figsize=(15, 12))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        # Error distribution by severity
-        errors = y_pred - y_true
-        ax1.hist(errors, bins=range(min(errors)-1, max(errors)+2), alpha=0.7, color='orange', edgecolor='black')
+        # Error distribution by severity: one signed histogram of (predicted - true),
+        # from which the error types and magnitudes below are also folded
+        errors = y_pred.astype(np.int32) - y_true.astype(np.int32)
+        min_error = int(errors.min())
+        error_counts_signed = np.bincount(errors - min_error)
+        error_values = np.arange(min_error, min_error + len(error_counts_signed))
+        
+        ax1.bar(error_values, error_counts_signed, width=1, align='edge', alpha=0.7, color='orange', edgecolor='black')
         ax1.set_xlabel('Prediction Error (Predicted - True)')
         ax1.set_ylabel('Frequency')
         ax1.set_title('Error Distribution')
         ax1.grid(True, alpha=0.3)
         
-        # Error heatmap
-        max_class = max(max(y_true), max(y_pred))
-        error_matrix = np.zeros((max_class + 1, max_class + 1))
-        
-        for true_val, pred_val in zip(y_true, y_pred):
-            error_matrix[true_val, pred_val] += 1
+        # Error heatmap over labels up to the largest one seen, from the shared label counts
+        max_class = int(max(y_true.max(), y_pred.max()))
+        error_matrix = label_counts[:max_class + 1, :max_class + 1].astype(float)
         
-        # Normalize by row (true class)
-        error_matrix_norm = error_matrix / (error_matrix.sum(axis=1, keepdims=True) + 1e-8)
+        # Normalize by row (true class); rows without samples stay at 0
+        row_sums = error_matrix.sum(axis=1, keepdims=True)
+        error_matrix_norm = np.divide(error_matrix, row_sums, out=np.zeros_like(error_matrix), where=row_sums > 0)
         
         im = ax2.imshow(error_matrix_norm, cmap='Reds', aspect='auto')
         ax2.set_xlabel('Predicted Class')
         ax2.set_ylabel('True Class')
         ax2.set_title('Error Pattern Heatmap (Normalized)')
         
-        # Add text annotations
-        for i in range(error_matrix_norm.shape[0]):
-            for j in range(error_matrix_norm.shape[1]):
-                text = ax2.text(j, i, f'{error_matrix_norm[i, j]:.2f}',
-                               ha="center", va="center", color="black" if error_matrix_norm[i, j] < 0.5 else "white")
+        # Add text annotations (one artist per cell, so only for small matrices)
+        if len(error_matrix_norm) <= _MAX_ANNOTATED_CLASSES:
+            rows, cols = np.indices(error_matrix_norm.shape)
+            cell_texts = np.char.mod('%.2f', error_matrix_norm)
+            cell_colors = np.where(error_matrix_norm < 0.5, 'black', 'white')
+            for i, j, cell_text, cell_color in zip(rows.ravel(), cols.ravel(), cell_texts.ravel(), cell_colors.ravel()):
+                ax2.text(j, i, cell_text, ha="center", va="center", color=cell_color)
         
-        plt.colorbar(im, ax=ax2)
+        fig.colorbar(im, ax=ax2)
         
         # Severity progression errors
         severity_errors = {
-            'Overestimation': np.sum(errors > 0),
-            'Underestimation': np.sum(errors < 0),
-            'Correct': np.sum(errors == 0)
+            'Overestimation': error_counts_signed[error_values > 0].sum(),
+            'Underestimation': error_counts_signed[error_values < 0].sum(),
+            'Correct': error_counts_signed[error_values == 0].sum()
         }
         
         ax3.pie(severity_errors.values(), labels=severity_errors.keys(), autopct='%1.1f%%', startangle=90)
         ax3.set_title('Prediction Error Types')
         
         # Error magnitude distribution
-        abs_errors = np.abs(errors)
-        error_counts = np.bincount(abs_errors)
+        error_counts = np.bincount(np.abs(error_values), weights=error_counts_signed).astype(np.int64)
         error_magnitudes = range(len(error_counts))
         
         ax4.bar(error_magnitudes, error_counts, alpha=0.7, color='red', edgecolor='black')
@@ -821,26 +994,28 @@ class PavementEvaluationMetrics:
         ax4.set_title('Error Magnitude Distribution')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(save_dir, 'error_analysis.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, save_dir, 'error_analysis.png')
     
     def _plot_pavement_analysis(self, 
                               y_true: np.ndarray, 
                               y_pred: np.ndarray,
-                              y_pred_proba: np.ndarray,
+                              max_probs: np.ndarray,
+                              label_counts: np.ndarray,
                               save_dir: str):
         """Plot pavement-specific analysis"""
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        
-        # Maintenance urgency confusion
-        urgency_mapping = {0: 'Low', 1: 'Low', 2: 'Medium', 3: 'High', 4: 'Critical'}
-        true_urgency = [urgency_mapping[x] for x in y_true]
-        pred_urgency = [urgency_mapping[x] for x in y_pred]
+        fig = Figure(figsize=(15, 12))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
+        # Maintenance urgency confusion, counted on integer urgency codes
         urgency_labels = ['Low', 'Medium', 'High', 'Critical']
-        urgency_matrix = confusion_matrix(true_urgency, pred_urgency, labels=urgency_labels)
+        num_urgencies = len(urgency_labels)
+        true_urgency = _URGENCY_LUT[y_true]
+        pred_urgency = _URGENCY_LUT[y_pred]
+        urgency_matrix = np.bincount(
+            true_urgency * num_urgencies + pred_urgency, minlength=num_urgencies * num_urgencies
+        ).reshape(num_urgencies, num_urgencies)
         
         sns.heatmap(urgency_matrix, annot=True, fmt='d', cmap='Oranges', ax=ax1,
                    xticklabels=urgency_labels, yticklabels=urgency_labels)
@@ -848,44 +1023,32 @@ class PavementEvaluationMetrics:
         ax1.set_xlabel('Predicted Urgency')
         ax1.set_ylabel('True Urgency')
         
-        # Critical error analysis
-        critical_errors = []
-        error_descriptions = []
-        
-        for true_val, pred_val in zip(y_true, y_pred):
-            if true_val == 4 and pred_val <= 1:  # Failed classified as good/excellent
-                critical_errors.append('Failed → Good/Excellent')
-            elif true_val == 3 and pred_val == 0:  # Poor classified as excellent
-                critical_errors.append('Poor → Excellent')
-            elif true_val <= 1 and pred_val == 4:  # Good/excellent classified as failed
-                critical_errors.append('Good/Excellent → Failed')
-            elif true_val == 0 and pred_val == 3:  # Excellent classified as poor
-                critical_errors.append('Excellent → Poor')
-        
-        if critical_errors:
-            error_counts = pd.Series(critical_errors).value_counts()
-            ax2.barh(range(len(error_counts)), error_counts.values, color='red', alpha=0.7)
-            ax2.set_yticks(range(len(error_counts)))
-            ax2.set_yticklabels(error_counts.index)
+        # Critical error analysis, most frequent first; labels follow _CRITICAL_ERROR_KEYS
+        critical_labels = np.array([
+            'Failed → Good/Excellent',
+            'Poor → Excellent',
+            'Good/Excellent → Failed',
+            'Excellent → Poor'
+        ])
+        critical_counts = _count_critical(y_true, y_pred)
+        order = np.argsort(-critical_counts, kind='stable')
+        order = order[critical_counts[order] > 0]
+        
+        if len(order) > 0:
+            ax2.barh(range(len(order)), critical_counts[order], color='red', alpha=0.7)
+            ax2.set_yticks(range(len(order)))
+            ax2.set_yticklabels(critical_labels[order])
             ax2.set_xlabel('Count')
             ax2.set_title('Critical Misclassifications')
         else:
             ax2.text(0.5, 0.5, 'No Critical Errors', ha='center', va='center', transform=ax2.transAxes)
             ax2.set_title('Critical Misclassifications')
         
-        # Economic impact visualization
-        cost_matrix = np.array([
-            [0, 50, 100, 500, 1000],
-            [100, 0, 50, 400, 900],
-            [300, 100, 0, 200, 700],
-            [800, 500, 300, 0, 300],
-            [2000, 1500, 1000, 500, 0]
-        ])
-        
-        economic_impact = np.zeros_like(cost_matrix)
-        for true_val, pred_val in zip(y_true, y_pred):
-            if true_val < len(cost_matrix) and pred_val < len(cost_matrix[0]):
-                economic_impact[true_val, pred_val] += cost_matrix[true_val, pred_val]
+        # Economic impact visualization: each cell's total cost is its sample
+        # count times its unit cost; labels outside the cost matrix are not costed
+        size = min(len(_COST_MATRIX), len(label_counts))
+        economic_impact = np.zeros_like(_COST_MATRIX)
+        economic_impact[:size, :size] = label_counts[:size, :size] * _COST_MATRIX[:size, :size]
         
         sns.heatmap(economic_impact, annot=True, fmt='.0f', cmap='Reds', ax=ax3,
                    xticklabels=self.class_names[:economic_impact.shape[1]],
@@ -899,7 +1062,7 @@ class PavementEvaluationMetrics:
         for condition in range(len(self.class_names[:len(np.unique(y_true))])):
             mask = y_true == condition
             if np.sum(mask) > 0:
-                condition_confidences[self.class_names[condition]] = np.max(y_pred_proba[mask], axis=1)
+                condition_confidences[self.class_names[condition]] = max_probs[mask]
         
         if condition_confidences:
             box_data = []
@@ -913,22 +1076,37 @@ class PavementEvaluationMetrics:
             ax4.set_title('Confidence by Pavement Condition')
             ax4.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(save_dir, 'pavement_specific_analysis.png'), dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, save_dir, 'pavement_specific_analysis.png')
     
     def _save_evaluation_report(self, results: Dict, save_dir: str):
         """Save comprehensive evaluation report"""
         
         # Save JSON report
-        with open(os.path.join(save_dir, 'evaluation_report.json'), 'w') as f:
-            # Convert numpy arrays to lists for JSON serialization
-            json_results = self._convert_numpy_to_list(results)
-            json.dump(json_results, f, indent=2, default=str)
+        report_path = os.path.join(save_dir, 'evaluation_report.json')
+        if orjson is not None:
+            # orjson serializes numpy scalars and C-contiguous arrays natively;
+            # other arrays (e.g. column-indexed views) fall back to lists
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    results, default=self._orjson_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(report_path, 'w') as f:
+                # Convert numpy arrays to lists for JSON serialization
+                json_results = self._convert_numpy_to_list(results)
+                json.dump(json_results, f, indent=2, default=str)
         
         # Generate markdown report
         self._generate_markdown_report(results, save_dir)
     
+    def _orjson_default(self, obj):
+        """Serialize values orjson does not handle natively"""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return str(obj)
+    
     def _convert_numpy_to_list(self, obj):
         """Recursively convert numpy arrays to lists for JSON serialization"""
         if isinstance(obj, np.ndarray):
@@ -120,7 +120,7 @@ class PavementAITrainer:
                 class_path = os.path.join(condition_path, class_name)
                 if os.path.exists(class_path):
                     for img_file in os.listdir(class_path):
-                        if img_file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                        if img_file.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
                             img_path = os.path.join(class_path, img_file)
                             img = self._load_and_preprocess_image(img_path)
                             if img is not None:
@@ -139,7 +139,7 @@ class PavementAITrainer:
                 class_path = os.path.join(crack_path, class_name)
                 if os.path.exists(class_path):
                     for img_file in os.listdir(class_path):
-                        if img_file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                        if img_file.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
                             img_path = os.path.join(class_path, img_file)
                             img = self._load_and_preprocess_image(img_path)
                             if img is not None:
@@ -163,7 +163,7 @@ class RealPavementDataProcessor:
                 if condition_dir.is_dir():
                     condition = condition_dir.name
                     for img_file in condition_dir.glob('*.*'):
-                        if img_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
+                        if img_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp']:
                             image_paths.append(str(img_file))
                             labels.append(condition)
                             metadata.append({
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+cv2 = pytest.importorskip('cv2')
+DataGenerator = pytest.importorskip('DataGenerator')
+
+
+class _FixedGridRng:
+    """Stand-in RNG: 40px blocks, no jitter and one fixed line thickness"""
+
+    def __init__(self, thickness):
+        self.thickness = thickness
+
+    def integers(self, low, high, size=None):
+        if size is None:
+            return 40
+        if low == -5:
+            return np.zeros(size, dtype=np.int64)
+        return np.full(size, self.thickness, dtype=np.int64)
+
+
+@pytest.mark.parametrize('thickness', [1, 2, 3])
+def test_block_crack_matches_cv2_line(thickness):
+    height, width = 150, 170
+    generator = DataGenerator.PavementDataGenerator(seed=0)
+    generator._rng = _FixedGridRng(thickness)
+    img = np.full((height, width, 3), 128, dtype=np.uint8)
+    generator._generate_block_crack(img)
+
+    expected = np.full((height, width, 3), 128, dtype=np.uint8)
+    for x in range(40, width, 40):
+        cv2.line(expected, (x, 0), (x, height), (20, 20, 20), thickness)
+    for y in range(40, height, 40):
+        cv2.line(expected, (0, y), (width, y), (20, 20, 20), thickness)
+
+    np.testing.assert_array_equal(img, expected)
+
+
+def test_aug_buffer_keeps_one_buffer_per_name():
+    generator = DataGenerator.PavementDataGenerator(seed=0)
+    first = generator._aug_buffer('augmented', np.zeros((32, 48, 3), dtype=np.uint8))
+    assert generator._aug_buffer('augmented', np.zeros((32, 48, 3), dtype=np.uint8)) is first
+
+    for shape in [(64, 48, 3), (20, 30, 3), (32, 48, 3)]:
+        buf = generator._aug_buffer('augmented', np.zeros(shape, dtype=np.uint8))
+        assert buf.shape == shape
+    noise = generator._aug_buffer('noise', buf, np.int16)
+
+    assert noise.dtype == np.int16
+    assert set(generator._aug_local.buffers) == {'augmented', 'noise'}
@@ -0,0 +1,41 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+EvaluationMetrics = pytest.importorskip('EvaluationMetrics')
+
+
+def _predictions(y_true, num_classes, seed=0):
+    """Noisy but informative class probabilities for the given labels"""
+    rng = np.random.default_rng(seed)
+    proba = rng.random((len(y_true), num_classes))
+    proba[np.arange(len(y_true)), y_true] += 1.0
+    return proba / proba.sum(axis=1, keepdims=True)
+
+
+def test_macro_auc_skips_classes_missing_from_test_set():
+    metrics = EvaluationMetrics.PavementEvaluationMetrics()
+    num_classes = len(metrics.class_names)
+    rng = np.random.default_rng(0)
+    # No samples of the 'fair' class (label 2)
+    y_true = rng.choice([0, 1, 3, 4], size=400)
+    y_pred_proba = _predictions(y_true, num_classes)
+
+    max_probs = y_pred_proba.max(axis=1)
+    correct = y_true == y_pred_proba.argmax(axis=1)
+    y_true_bin = metrics._binarize_labels(y_true, num_classes)
+    roc_curves = metrics._roc_curves(y_true_bin, y_pred_proba)
+    advanced = metrics._calculate_advanced_metrics(
+        y_true, y_pred_proba, max_probs, correct, y_true_bin, roc_curves
+    )
+
+    assert math.isnan(advanced['roc_auc_per_class']['fair'])
+    assert math.isnan(advanced['pr_auc_per_class']['fair'])
+    for name in ('roc_auc', 'pr_auc'):
+        defined = [score for score in advanced[f'{name}_per_class'].values() if not math.isnan(score)]
+        assert len(defined) == num_classes - 1
+        assert advanced[f'{name}_macro'] == pytest.approx(np.mean(defined))